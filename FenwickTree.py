@@ -1,26 +1,140 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the batch methods fall back to plain loops.
+    np = None
+
+
+def _as_numbers(values):
+    """
+    Convert values to a NumPy array. Python ints that only fit together as
+    floats (e.g. mixing negative and uint64 values) are kept exact as objects.
+    """
+    numbers = np.asarray(values)
+    if numbers.dtype.kind == "f" and not isinstance(values, np.ndarray):
+        if all(isinstance(value, int) for value in values):
+            numbers = np.array(values, dtype=object)
+    return numbers
+
+
 class FenwickTree:
-    def __init__(self, n: int):
+    def __init__(self, n: int, typecode: str = None):
         """
         Initialize a Fenwick Tree(Binary Indexed Tree) with 'n' elements.
 
         Parameters:
             n (int): Size of the array.
+            typecode (str): Optional `array.array` typecode (e.g. 'q' or 'd').
+                When given, the tree is stored in a compact typed array that the
+                batch methods can process with NumPy, and that only holds values
+                of its type ('q' raises OverflowError past 64 bits and TypeError
+                on floats). Otherwise a plain list of Python numbers is used.
         """
-        self.tree = [0] * (n + 1)
+        if typecode is None:
+            self.tree = [0] * (n + 1)
+        else:
+            self.tree = array(typecode, [0]) * (n + 1)
         self.size = n
 
+    @classmethod
+    def from_array(cls, values, typecode: str = None) -> "FenwickTree":
+        """
+        Build a Fenwick Tree from existing values in O(n).
+
+        Each node pushes its partial sum to its parent once, instead of doing
+        one O(log n) update per element.
+
+        Parameters:
+            values (iterable): The initial values, values[0] is stored at index 1.
+            typecode (str): Optional `array.array` typecode, see `__init__`.
+
+        Return:
+            (FenwickTree): The built tree.
+        """
+        if np is None or not isinstance(values, np.ndarray):
+            values = list(values)
+        n = len(values)
+        fenwick_tree = cls(n, typecode)
+        tree = fenwick_tree.tree
+        view = fenwick_tree._view()
+
+        if view is not None:
+            values = _as_numbers(values)
+            limit = fenwick_tree._limit(values)
+            # Partial sums could wrap around in NumPy, build with the scalar loop
+            # instead, which raises OverflowError like `update`.
+            if limit is not None and n and np.abs(values.astype(np.float64)).sum() > limit:
+                view = None
+
+        if view is not None:
+            view[1:] = values
+            # Nodes whose lsb is 2^k are complete once every lower level has
+            # been pushed, so a whole level can be propagated at once.
+            step = 1
+            while step <= n:
+                index = np.arange(step, n + 1 - step, 2 * step)
+                view[index + step] += view[index]
+                step *= 2
+            return fenwick_tree
+
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+        tree[1:] = array(typecode, values) if typecode is not None else values
+        for index in range(1, n + 1):
+            parent = index + (index & -index)
+            if parent <= n:
+                tree[parent] += tree[index]
+        return fenwick_tree
+
+    def _limit(self, values):
+        """
+        Return the largest magnitude an integer tree can safely reach through
+        NumPy, or None for a float tree. Raise TypeError or OverflowError for
+        values an integer tree cannot hold, as `array.array` does.
+        """
+        typecode = self.tree.typecode
+        if typecode not in "bBhHiIlLqQ":
+            return None
+        if values.size and values.dtype.kind == "f":
+            raise TypeError("integer values expected for typecode {!r}.".format(typecode))
+        info = np.iinfo(self._view().dtype)
+        if values.size and (values.min() < info.min or values.max() > info.max):
+            raise OverflowError("value out of range for typecode {!r}.".format(typecode))
+        # Keep a margin for the rounding of the float64 bounds it is compared to.
+        return float(info.max) * 0.99
+
+    def _view(self):
+        """
+        Return a NumPy view sharing memory with the tree, or None when the tree
+        is a plain list or NumPy is not installed.
+        """
+        if np is None or isinstance(self.tree, list):
+            return None
+        return np.frombuffer(self.tree, dtype=self.tree.typecode)
+
     def update(self, index: int, delta: int):
         """
         Update the Fenwick Tree with a delta at a specific index.
 
+        With array storage, a node leaving the range of the typecode raises
+        OverflowError and the nodes already updated are restored.
+
         Parameters:
             index (int): The index to update.
             delta (int): The value to add at the index.
         """
 
-        while index <= self.size:
-            self.tree[index] += delta
-            index += index & -index  # Computes the least valuable bit(lsb)
+        start = index
+        try:
+            while index <= self.size:
+                self.tree[index] += delta
+                index += index & -index  # Computes the least valuable bit(lsb)
+        except OverflowError:
+            while start < index:
+                self.tree[start] -= delta
+                start += start & -start
+            raise
 
     def query(self, index: int) -> int:
         """
@@ -53,6 +167,253 @@ class FenwickTree:
         """
         return self.query(right) - self.query(left - 1)
 
+    def update_many(self, indices, deltas):
+        """
+        Apply several point updates at once.
+
+        With array storage and NumPy available, every element climbs one level
+        per pass, so the whole batch takes O(log n) vectorized passes.
+
+        Like `update`, an integer tree raises OverflowError instead of wrapping
+        around, and leaves the tree unchanged. Batches whose sums could leave
+        the range of the typecode are applied with scalar updates instead.
+
+        Parameters:
+            indices (iterable): The indices to update (1-indexed).
+            deltas (iterable): The value to add at each index.
+        """
+        view = self._view()
+        if view is None:
+            for index, delta in zip(indices, deltas):
+                self.update(index, delta)
+            return
+
+        indices = np.array(indices, dtype=np.int64)
+        deltas = _as_numbers(deltas)
+        if indices.shape != deltas.shape:
+            raise ValueError("indices and deltas must have the same length.")
+        if indices.size and indices.min() < 1:
+            raise IndexError("Fenwick Tree indices start at 1.")
+
+        limit = self._limit(deltas)
+        deltas = deltas.astype(view.dtype)
+
+        # Work out every pass before writing, so an overflow is caught up front.
+        passes = []
+        climbing, climbing_deltas = indices, deltas
+        while climbing.size:
+            inside = climbing <= self.size
+            climbing, climbing_deltas = climbing[inside], climbing_deltas[inside]
+            if climbing.size:
+                passes.append((climbing, climbing_deltas))
+            climbing = climbing + (climbing & -climbing)
+
+        if limit is not None and passes:
+            # No node can move further than the sum of all the deltas.
+            reach = max(np.abs(view[nodes].astype(np.float64)).max() for nodes, _ in passes)
+            if reach + np.abs(deltas.astype(np.float64)).sum() > limit:
+                self._update_each(indices.tolist(), deltas.tolist())
+                return
+
+        for nodes, node_deltas in passes:
+            # np.add.at accumulates repeated indices instead of keeping the last.
+            np.add.at(view, nodes, node_deltas)
+
+    def _update_each(self, indices, deltas):
+        """
+        Apply point updates one by one, undoing all of them if one overflows.
+        """
+        done = []
+        try:
+            for index, delta in zip(indices, deltas):
+                self.update(index, delta)
+                done.append((index, delta))
+        except OverflowError:
+            for index, delta in reversed(done):
+                self.update(index, -delta)
+            raise
+
+    def query_many(self, indices) -> "list | numpy.ndarray":
+        """
+        Compute the prefix sums for several indices at once.
+
+        Sums of a signed integer tree are accumulated in 64 bits, so unlike
+        `query` they wrap around past the int64 range.
+
+        Parameters:
+            indices (iterable): The indices to compute the prefix sums up to.
+
+        Return:
+            (list | numpy.ndarray): The computed sums, an array when NumPy is used.
+        """
+        view = self._view()
+        if view is None:
+            return [self.query(index) for index in indices]
+
+        indices = np.array(indices, dtype=np.int64)
+        sums = np.zeros(indices.shape, dtype=np.int64 if view.dtype.kind == "i" else view.dtype)
+        # tree[0] is always 0, so finished indices can keep taking part.
+        while indices.any():
+            sums += view[indices]
+            indices -= indices & -indices
+        return sums
+
+    def range_query_many(self, lefts, rights) -> "list | numpy.ndarray":
+        """
+        Get the sums of several ranges [left, right] (1-indexed) at once.
+
+        Parameters:
+            lefts (iterable): The starting indices of the ranges.
+            rights (iterable): The ending indices of the ranges.
+
+        Return:
+            (list | numpy.ndarray): The sums of each range.
+        """
+        if self._view() is None:
+            return [self.range_query(left, right) for left, right in zip(lefts, rights)]
+
+        lefts = np.asarray(lefts, dtype=np.int64)
+        return self.query_many(rights) - self.query_many(lefts - 1)
+
+
+class RangeFenwickTree:
+    def __init__(self, n: int, typecode: str = None):
+        """
+        Initialize a Fenwick Tree supporting range updates and range queries.
+
+        Two Fenwick Trees are kept: adding 'delta' on [left, right] makes the
+        prefix sum up to 'i' equal to b1(i) * i - b2(i), so both operations stay
+        in O(log n).
+
+        Parameters:
+            n (int): Size of the array.
+            typecode (str): Optional `array.array` typecode for both trees.
+        """
+        self.b1 = FenwickTree(n, typecode)
+        self.b2 = FenwickTree(n, typecode)
+        self.size = n
+
+    def range_update(self, left: int, right: int, delta: int):
+        """
+        Add a delta to every element of the range [left, right] (1-indexed).
+
+        Parameters:
+            left (int): The starting index of the range.
+            right (int): The ending index of the range.
+            delta (int): The value to add to each element.
+        """
+        self.b1.update(left, delta)
+        self.b1.update(right + 1, -delta)
+        self.b2.update(left, delta * (left - 1))
+        self.b2.update(right + 1, -delta * right)
+
+    def update(self, index: int, delta: int):
+        """
+        Add a delta at a specific index.
+
+        Parameters:
+            index (int): The index to update.
+            delta (int): The value to add at the index.
+        """
+        self.range_update(index, index, delta)
+
+    def query(self, index: int) -> int:
+        """
+        Compute the prefix sum from the start to the given index.
+
+        Parameters:
+            index (int): The index to compute the prefix sum up to.
+
+        Return:
+            (int): The computed sum.
+        """
+        return self.b1.query(index) * index - self.b2.query(index)
+
+    def range_query(self, left: int, right: int) -> int:
+        """
+        Get the sum of the range [left, right] (1-indexed).
+
+        Parameters:
+            left (int): The starting index of the range.
+            right (int): The ending index of the range.
+
+        Returns:
+            (int): The sum from left to right (inclusive).
+        """
+        return self.query(right) - self.query(left - 1)
+
+
+class FenwickTree2D:
+    def __init__(self, rows: int, cols: int):
+        """
+        Initialize a 2-D Fenwick Tree over a 'rows' x 'cols' grid.
+
+        Parameters:
+            rows (int): Number of rows in the grid.
+            cols (int): Number of columns in the grid.
+        """
+        self.tree = [[0] * (cols + 1) for _ in range(rows + 1)]
+        self.rows = rows
+        self.cols = cols
+
+    def update(self, row: int, col: int, delta: int):
+        """
+        Add a delta to the cell (row, col) (1-indexed) in O(log rows * log cols).
+
+        Parameters:
+            row (int): The row of the cell.
+            col (int): The column of the cell.
+            delta (int): The value to add to the cell.
+        """
+        while row <= self.rows:
+            tree_row = self.tree[row]
+            index = col
+            while index <= self.cols:
+                tree_row[index] += delta
+                index += index & -index
+            row += row & -row
+
+    def query(self, row: int, col: int) -> int:
+        """
+        Compute the sum of the rectangle from (1, 1) to (row, col).
+
+        Parameters:
+            row (int): The last row of the rectangle.
+            col (int): The last column of the rectangle.
+
+        Return:
+            (int): The computed sum.
+        """
+        sum = 0
+        while row > 0:
+            tree_row = self.tree[row]
+            index = col
+            while index > 0:
+                sum += tree_row[index]
+                index -= index & -index
+            row -= row & -row
+        return sum
+
+    def range_query(self, row1: int, col1: int, row2: int, col2: int) -> int:
+        """
+        Get the sum of the rectangle from (row1, col1) to (row2, col2) inclusive.
+
+        Parameters:
+            row1 (int): The first row of the rectangle.
+            col1 (int): The first column of the rectangle.
+            row2 (int): The last row of the rectangle.
+            col2 (int): The last column of the rectangle.
+
+        Returns:
+            (int): The sum of the rectangle.
+        """
+        return (
+            self.query(row2, col2)
+            - self.query(row1 - 1, col2)
+            - self.query(row2, col1 - 1)
+            + self.query(row1 - 1, col1 - 1)
+        )
+
 
 if __name__ == "__main__":
     fenwick_tree = FenwickTree(5)
@@ -74,3 +435,22 @@ if __name__ == "__main__":
     print(
         "Sum from index 2 to 4:", fenwick_tree.range_query(2, 4)
     )  # Output: 12 (5 + 3 + 4)
+
+    bulk_tree = FenwickTree.from_array([1, 5, 3, 4, 5], typecode="q")
+    print(
+        "Prefix sums built in O(n):", [int(s) for s in bulk_tree.query_many([1, 2, 3, 4, 5])]
+    )  # Output: [1, 6, 9, 13, 18]
+
+    range_tree = RangeFenwickTree(5)
+    range_tree.range_update(2, 4, 10)  # Add 10 to indices 2, 3 and 4
+    print(
+        "Sum from index 1 to 3 after range update:", range_tree.range_query(1, 3)
+    )  # Output: 20
+
+    grid = FenwickTree2D(3, 3)
+    grid.update(1, 1, 2)
+    grid.update(2, 3, 5)
+    grid.update(3, 2, 7)
+    print(
+        "Sum of rectangle (2, 2) to (3, 3):", grid.range_query(2, 2, 3, 3)
+    )  # Output: 12 (5 + 7)
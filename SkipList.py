@@ -1,31 +1,46 @@
 import random
+import threading
+import time
 
 
 class SkipNode:
     """
     A SkipList Node
     """
-    def __init__(self, value, level):
+    __slots__ = ('key', 'value', 'next', 'width')
+
+    def __init__(self, key, value, level):
         """
         Initialize a skip list node.
         Parameters:
-            value (int): The integer value to store in the node.
+            key: The key the node is ordered by.
+            value: The value stored in the node.
             level (int): The level of the node (how many next pointers it will have).
         """
+        self.key = key
         self.value = value
         self.next = [None] * (level + 1)
+        # width[i] is how many level 0 steps next[i] skips (to the end when it is None).
+        self.width = [1] * (level + 1)
 
 
 class SkipList:
-    def __init__(self, max_level):
+    def __init__(self, max_level=0, key=None):
         """
         Initialize the skip list.
-        
+
+        Values inserted with `insert` are ordered by key(value), while the
+        mapping methods (`list[key] = value`) store a key and a value directly.
+
         Parameters:
-            max_level (int): The maximum number of levels in the skip list.
+            max_level (int): The initial maximum level of the skip list. It grows
+                with log2 of the size, so the search stays logarithmic.
+            key (callable): Function extracting the comparison key from a value,
+                the value itself by default.
         """
         self.maxLevel = max_level
-        self.head = SkipNode(None, max_level)  
+        self.key = key if key is not None else _identity
+        self.head = SkipNode(None, None, max_level)
         self.level = 0
         self.size = 0
 
@@ -35,94 +50,693 @@ class SkipList:
     def random_level(self):
         """
         Generate a random level for the new node.
-        
+
+        The level is the number of trailing zero bits of one random draw, which
+        is geometric with p = 1/2 like flipping a coin per level.
+
         Returns:
             int: The level of the new node (randomly generated).
         """
-        level = 0
-        while random.random() < 0.5 and level < self.maxLevel:
-            level += 1
-        return level
+        bits = random.getrandbits(self.maxLevel)
+        if bits == 0:
+            return self.maxLevel
+        return (bits & -bits).bit_length() - 1
 
-    def insert(self, value):
+    def _grow(self):
         """
-        Insert an integer value into the skip list.
-        
-        Parameters:
-            value (int): The integer value to insert.
+        Raise the maximum level to log2 of the size, extending the head node.
+        """
+        wanted = self.size.bit_length()
+        if wanted > self.maxLevel:
+            self.head.next.extend([None] * (wanted - self.maxLevel))
+            self.head.width.extend([1] * (wanted - self.maxLevel))
+            self.maxLevel = wanted
+
+    def _find_update(self, key):
+        """
+        Return the last node before key on every level, and the position of
+        each of these nodes (the head is at 0, the first node at 1).
         """
         update = [None] * (self.maxLevel + 1)
+        ranks = [0] * (self.maxLevel + 1)
         current = self.head
+        position = 0
 
         for i in range(self.level, -1, -1):
-            while current.next[i] and current.next[i].value < value:
+            while current.next[i] and current.next[i].key < key:
+                position += current.width[i]
                 current = current.next[i]
             update[i] = current
+            ranks[i] = position
+        return update, ranks
 
+    def _new_finger(self):
+        """
+        Return update and ranks lists positioned at the head, for `_advance`.
+        """
+        return [self.head] * (self.maxLevel + 1), [0] * (self.maxLevel + 1)
+
+    def _advance(self, key, update, ranks):
+        """
+        Move update and ranks (as returned by `_find_update` for a key not
+        larger than key) forward to the last nodes before key.
+
+        The search first climbs from level 0 until the pointer of the finger
+        no longer passes key, then goes down from there, so it costs O(log d)
+        where d is the distance between the two keys instead of O(log n).
+        """
+        top = 0
+        while top <= self.level and update[top].next[top] is not None and update[top].next[top].key < key:
+            top += 1
+
+        for i in range(top - 1, -1, -1):
+            # Start from whichever of the two fingers is further along.
+            if i + 1 < len(update) and ranks[i + 1] > ranks[i]:
+                current, position = update[i + 1], ranks[i + 1]
+            else:
+                current, position = update[i], ranks[i]
+            while current.next[i] and current.next[i].key < key:
+                position += current.width[i]
+                current = current.next[i]
+            update[i] = current
+            ranks[i] = position
+
+    def _find(self, key):
+        """
+        Return the node holding key, or None.
+        """
+        current = self.head
+
+        for i in range(self.level, -1, -1):
+            while current.next[i] and current.next[i].key < key:
+                current = current.next[i]
         current = current.next[0]
 
-        if current is None or current.value != value:
-            new_level = self.random_level()
-            if new_level > self.level:
-                for i in range(self.level + 1, new_level + 1):
-                    update[i] = self.head
-                self.level = new_level
+        if current is not None and current.key == key:
+            return current
+        return None
 
-            new_node = SkipNode(value, new_level)
+    def _insert(self, key, value, replace, finger=None):
+        """
+        Insert a node for key, or update the value of an existing one when replace is True.
+        A finger (update, ranks) from a previous operation on a smaller key is
+        advanced instead of searching from the head, and kept up to date.
+        """
+        if finger is None:
+            update, ranks = self._find_update(key)
+        else:
+            update, ranks = finger
+            self._advance(key, update, ranks)
+        current = update[0].next[0]
+
+        if current is not None and current.key == key:
+            if replace:
+                current.value = value
+            return
+
+        self.size += 1
+        self._grow()
+        update.extend([self.head] * (self.maxLevel + 1 - len(update)))
+        ranks.extend([0] * (self.maxLevel + 1 - len(ranks)))
+        new_level = self.random_level()
+        if new_level > self.level:
+            for i in range(self.level + 1, new_level + 1):
+                update[i] = self.head
+                ranks[i] = 0
+                self.head.width[i] = self.size
+            self.level = new_level
 
-            for i in range(new_level + 1):
-                new_node.next[i] = update[i].next[i]
-                update[i].next[i] = new_node
+        new_node = SkipNode(key, value, new_level)
 
-            self.size += 1
+        for i in range(new_level + 1):
+            new_node.next[i] = update[i].next[i]
+            update[i].next[i] = new_node
+            skipped = ranks[0] - ranks[i]
+            new_node.width[i] = update[i].width[i] - skipped
+            update[i].width[i] = skipped + 1
+
+        for i in range(new_level + 1, self.level + 1):
+            update[i].width[i] += 1
+
+    def _delete(self, key, finger=None):
+        """
+        Remove the node holding key. Return True if it was found.
+        A finger works as in `_insert`.
+        """
+        if finger is None:
+            update, _ = self._find_update(key)
+        else:
+            update, ranks = finger
+            self._advance(key, update, ranks)
+        current = update[0].next[0]
+
+        if current and current.key == key:
+            for i in range(self.level, -1, -1):
+                if update[i].next[i] == current:
+                    update[i].width[i] += current.width[i] - 1
+                    update[i].next[i] = current.next[i]
+                else:
+                    update[i].width[i] -= 1
+
+            while self.level > 0 and self.head.next[self.level] is None:
+                self.level -= 1
+
+            self.size -= 1
+            return True
+        return False
+
+    def insert(self, value):
+        """
+        Insert a value into the skip list, unless one with the same key is present.
+        
+        Parameters:
+            value: The value to insert.
+        """
+        self._insert(self.key(value), value, replace=False)
 
     def search(self, value):
         """
-        Search for an integer value in the skip list.
+        Search for a value in the skip list.
 
         Parameters:
-            value (int): The integer value to search for.
+            value: The value to search for.
 
         Return:
             bool: True if the value is found, False otherwise.
         """
+        return self._find(self.key(value)) is not None
+
+    def delete(self, value):
+        """
+        Delete a value from the skip list.
+        
+        Parameters:
+            value: The value to delete.
+        """
+        self._delete(self.key(value))
+
+    def _batch(self, values, operation):
+        """
+        Apply operation(key, value, finger) to every value, reusing the finger
+        while the keys increase and starting a fresh one when they do not.
+        """
+        finger = self._new_finger()
+        previous = None
+        for value in values:
+            key = self.key(value)
+            if previous is not None and key < previous:
+                finger = self._new_finger()
+            previous = key
+            yield operation(key, value, finger)
+
+    def insert_many(self, values):
+        """
+        Insert several values. When they are sorted by key, each insertion
+        starts from the previous one's search path (a finger) and costs
+        O(log d) for a distance d between consecutive keys.
+
+        Parameters:
+            values (iterable): The values to insert, ideally sorted.
+        """
+        for _ in self._batch(values, lambda key, value, finger: self._insert(key, value, False, finger)):
+            pass
+
+    def search_many(self, values):
+        """
+        Search for several values, using a finger like `insert_many`.
+
+        Parameters:
+            values (iterable): The values to search for, ideally sorted.
+
+        Return:
+            list: True for every value that is found, False otherwise.
+        """
+        def search(key, value, finger):
+            update, ranks = finger
+            self._advance(key, update, ranks)
+            current = update[0].next[0]
+            return current is not None and current.key == key
+
+        return list(self._batch(values, search))
+
+    def delete_many(self, values):
+        """
+        Delete several values, using a finger like `insert_many`.
+
+        Parameters:
+            values (iterable): The values to delete, ideally sorted.
+
+        Return:
+            int: The number of values that were found and deleted.
+        """
+        return sum(self._batch(values, lambda key, value, finger: self._delete(key, finger)))
+
+    @classmethod
+    def from_sorted(cls, values, key=None):
+        """
+        Build a skip list from values sorted by strictly increasing key in O(n).
+
+        Levels are assigned deterministically: the node at position p gets the
+        number of trailing zero bits of p, as in a perfectly balanced skip list.
+
+        Parameters:
+            values (iterable): The values, sorted by key.
+            key (callable): Function extracting the comparison key from a value.
+
+        Return:
+            SkipList: The built skip list.
+        """
+        values = list(values)
+        skip_list = cls(len(values).bit_length(), key)
+        head = skip_list.head
+        # The last node linked on every level and its position.
+        last = [head] * (skip_list.maxLevel + 1)
+        last_position = [0] * (skip_list.maxLevel + 1)
+        previous = None
+
+        for position, value in enumerate(values, 1):
+            node_key = skip_list.key(value)
+            if previous is not None and not previous < node_key:
+                raise ValueError("Values must be sorted by strictly increasing key.")
+            previous = node_key
+
+            level = (position & -position).bit_length() - 1
+            node = SkipNode(node_key, value, level)
+            for i in range(level + 1):
+                last[i].next[i] = node
+                last[i].width[i] = position - last_position[i]
+                last[i] = node
+                last_position[i] = position
+            skip_list.level = max(skip_list.level, level)
+
+        for i in range(skip_list.maxLevel + 1):
+            last[i].width[i] = len(values) + 1 - last_position[i]
+        skip_list.size = len(values)
+        return skip_list
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __getitem__(self, key):
+        """
+        Return the value stored for key. A slice selects values by position
+        instead, so list[k:k + 100] is the page of 100 values from position k.
+        """
+        if isinstance(key, slice):
+            positions = range(*key.indices(self.size))
+            if not positions:
+                return []
+            first = min(positions[0], positions[-1])
+            block = list(self._values_from(self._node_at(first), len(positions) * abs(positions.step)))
+            return [block[position - first] for position in positions]
+
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key, value):
+        self._insert(key, value, replace=True)
+
+    def __delitem__(self, key):
+        if not self._delete(key):
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        """
+        Return the value stored for key, or default if it is not in the skip list.
+        """
+        node = self._find(key)
+        return node.value if node is not None else default
+
+    def _node_at(self, index):
+        """
+        Return the node at position index (0-indexed), in O(log n) by following
+        the pointer widths.
+        """
+        if not 0 <= index < self.size:
+            raise IndexError("skip list index out of range")
+        target = index + 1
         current = self.head
+        position = 0
 
         for i in range(self.level, -1, -1):
-            while current.next[i] and current.next[i].value < value:
+            while current.next[i] and position + current.width[i] <= target:
+                position += current.width[i]
                 current = current.next[i]
+        return current
+
+    def _values_from(self, node, count=None):
+        """
+        Yield the values of node and of the nodes after it on level 0.
+        """
+        while node is not None and count != 0:
+            yield node.value
+            node = node.next[0]
+            if count is not None:
+                count -= 1
+
+    def select(self, index):
+        """
+        Return the value at position index (0-indexed) in O(log n).
+
+        Parameters:
+            index (int): The position of the value.
+
+        Return:
+            The value at that position.
+        """
+        return self._node_at(index).value
+
+    def rank(self, value):
+        """
+        Return the number of values whose key is smaller than key(value), in O(log n).
+
+        Parameters:
+            value: The value to rank.
+
+        Return:
+            int: The position value has, or would have, in the skip list.
+        """
+        _, ranks = self._find_update(self.key(value))
+        return ranks[0]
+
+    def range(self, lo=None, hi=None):
+        """
+        Lazily yield the values whose key is in [lo, hi), in order. A bound of
+        None is unbounded.
+
+        Parameters:
+            lo: The smallest key to yield.
+            hi: The key to stop before.
+        """
+        current = self.head
+        if lo is not None:
+            for i in range(self.level, -1, -1):
+                while current.next[i] and current.next[i].key < lo:
+                    current = current.next[i]
         current = current.next[0]
 
-        return current is not None and current.value == value
+        while current is not None and (hi is None or current.key < hi):
+            yield current.value
+            current = current.next[0]
+
+    def __iter__(self):
+        return self._values_from(self.head.next[0])
+
+    def keys(self):
+        """
+        Yield the keys in order.
+        """
+        current = self.head.next[0]
+        while current is not None:
+            yield current.key
+            current = current.next[0]
+
+    def items(self):
+        """
+        Yield the (key, value) pairs in order.
+        """
+        current = self.head.next[0]
+        while current is not None:
+            yield current.key, current.value
+            current = current.next[0]
+
+
+class ConcurrentSkipNode:
+    """
+    A ConcurrentSkipList Node
+    """
+    __slots__ = ('key', 'value', 'next', 'lock', 'marked', 'fully_linked')
+
+    def __init__(self, key, value, level):
+        """
+        Initialize a concurrent skip list node.
+        Parameters:
+            key: The key the node is ordered by.
+            value: The value stored in the node.
+            level (int): The level of the node (how many next pointers it will have).
+        """
+        self.key = key
+        self.value = value
+        self.next = [None] * (level + 1)
+        self.lock = threading.Lock()
+        # Set, under the lock, when the node is being removed.
+        self.marked = False
+        # Set once the node is linked on all of its levels.
+        self.fully_linked = False
+
+
+class ConcurrentSkipList:
+    def __init__(self, max_level=32, key=None):
+        """
+        Initialize a skip list that can be shared between threads (a lazy skip list).
+
+        Searches take no lock and never block. Writers lock only the
+        predecessors found by their search (the update[] nodes of SkipList),
+        check that those are still unmarked and still point where the search
+        saw them, and retry otherwise. Locks are always taken in decreasing
+        key order, so writers cannot deadlock.
+
+        The head node cannot be resized safely while other threads use it, so
+        unlike SkipList the maximum level is fixed.
+
+        Parameters:
+            max_level (int): The maximum level of the skip list.
+            key (callable): Function extracting the comparison key from a value,
+                the value itself by default.
+        """
+        self.maxLevel = max_level
+        self.key = key if key is not None else _identity
+        self.head = ConcurrentSkipNode(None, None, max_level)
+        self.head.fully_linked = True
+        self.size = 0
+        self._size_lock = threading.Lock()
+
+    def __len__(self):
+        return self.size
+
+    def random_level(self):
+        """
+        Generate a random level for the new node, see SkipList.random_level.
+
+        Returns:
+            int: The level of the new node (randomly generated).
+        """
+        bits = random.getrandbits(self.maxLevel)
+        if bits == 0:
+            return self.maxLevel
+        return (bits & -bits).bit_length() - 1
+
+    def _find(self, key, preds, succs):
+        """
+        Fill preds and succs with the nodes around key on every level, without locking.
+
+        Return:
+            int: The highest level where a node holding key was found, or -1.
+        """
+        found = -1
+        pred = self.head
+        for i in range(self.maxLevel, -1, -1):
+            current = pred.next[i]
+            while current is not None and current.key < key:
+                pred = current
+                current = pred.next[i]
+            if found == -1 and current is not None and current.key == key:
+                found = i
+            preds[i] = pred
+            succs[i] = current
+        return found
+
+    def _lookup(self, key):
+        """
+        Return the node holding key if it is in the skip list, or None. Never blocks.
+        """
+        pred = self.head
+        current = None
+        for i in range(self.maxLevel, -1, -1):
+            current = pred.next[i]
+            while current is not None and current.key < key:
+                pred = current
+                current = pred.next[i]
+        if current is not None and current.key == key and current.fully_linked and not current.marked:
+            return current
+        return None
+
+    def _insert(self, key, value, replace):
+        """
+        Insert a node for key, or update the value of an existing one when replace is True.
+        Return True if a node was inserted.
+        """
+        top = self.random_level()
+        preds = [None] * (self.maxLevel + 1)
+        succs = [None] * (self.maxLevel + 1)
+
+        while True:
+            found = self._find(key, preds, succs)
+            if found != -1:
+                node = succs[found]
+                if not node.marked:
+                    # Another writer is still linking it, wait until it is visible.
+                    while not node.fully_linked:
+                        time.sleep(0)
+                    if replace:
+                        node.value = value
+                    return False
+                # The node is being removed, search again.
+                continue
+
+            locked = []
+            try:
+                valid = True
+                for i in range(top + 1):
+                    pred, succ = preds[i], succs[i]
+                    if not locked or locked[-1] is not pred:
+                        pred.lock.acquire()
+                        locked.append(pred)
+                    valid = not pred.marked and (succ is None or not succ.marked) and pred.next[i] is succ
+                    if not valid:
+                        break
+                if not valid:
+                    continue
+
+                new_node = ConcurrentSkipNode(key, value, top)
+                for i in range(top + 1):
+                    new_node.next[i] = succs[i]
+                for i in range(top + 1):
+                    preds[i].next[i] = new_node
+                new_node.fully_linked = True
+            finally:
+                for node in locked:
+                    node.lock.release()
+
+            with self._size_lock:
+                self.size += 1
+            return True
+
+    def _delete(self, key):
+        """
+        Remove the node holding key. Return True if it was found.
+        """
+        preds = [None] * (self.maxLevel + 1)
+        succs = [None] * (self.maxLevel + 1)
+        victim = None
+
+        while True:
+            found = self._find(key, preds, succs)
+            if victim is None:
+                if found == -1:
+                    return False
+                candidate = succs[found]
+                # Only a fully linked node found on its own top level can be removed.
+                if not candidate.fully_linked or candidate.marked or len(candidate.next) - 1 != found:
+                    return False
+                candidate.lock.acquire()
+                if candidate.marked:
+                    candidate.lock.release()
+                    return False
+                candidate.marked = True
+                victim = candidate
+
+            top = len(victim.next) - 1
+            locked = []
+            try:
+                valid = True
+                for i in range(top + 1):
+                    pred = preds[i]
+                    if not locked or locked[-1] is not pred:
+                        pred.lock.acquire()
+                        locked.append(pred)
+                    valid = not pred.marked and pred.next[i] is victim
+                    if not valid:
+                        break
+                if not valid:
+                    continue
+
+                for i in range(top, -1, -1):
+                    preds[i].next[i] = victim.next[i]
+                victim.lock.release()
+            finally:
+                for node in locked:
+                    node.lock.release()
+
+            with self._size_lock:
+                self.size -= 1
+            return True
+
+    def insert(self, value):
+        """
+        Insert a value into the skip list, unless one with the same key is present.
+
+        Parameters:
+            value: The value to insert.
+
+        Return:
+            bool: True if the value was inserted.
+        """
+        return self._insert(self.key(value), value, replace=False)
+
+    def search(self, value):
+        """
+        Search for a value in the skip list without taking any lock.
+
+        Parameters:
+            value: The value to search for.
+
+        Return:
+            bool: True if the value is found, False otherwise.
+        """
+        return self._lookup(self.key(value)) is not None
 
     def delete(self, value):
         """
-        Delete an integer value from the skip list.
-        
+        Delete a value from the skip list.
+
         Parameters:
-            value (int): The integer value to delete.
+            value: The value to delete.
+
+        Return:
+            bool: True if the value was found and deleted.
         """
-        update = [None] * (self.maxLevel + 1)
-        current = self.head
+        return self._delete(self.key(value))
 
-        for i in range(self.level, -1, -1):
-            while current.next[i] and current.next[i].value < value:
-                current = current.next[i]
-            update[i] = current
+    def __contains__(self, key):
+        return self._lookup(key) is not None
 
-        current = current.next[0]
+    def __getitem__(self, key):
+        node = self._lookup(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
 
-        if current and current.value == value:
-            for i in range(self.level, -1, -1):
-                if update[i].next[i] == current:
-                    update[i].next[i] = current.next[i]
+    def __setitem__(self, key, value):
+        self._insert(key, value, replace=True)
 
-            while self.level > 0 and self.head.next[self.level] is None:
-                self.level -= 1
+    def __delitem__(self, key):
+        if not self._delete(key):
+            raise KeyError(key)
 
-            self.size -= 1
+    def get(self, key, default=None):
+        """
+        Return the value stored for key, or default if it is not in the skip list.
+        """
+        node = self._lookup(key)
+        return node.value if node is not None else default
+
+    def __iter__(self):
+        """
+        Yield the values in order. Concurrent changes may or may not be seen.
+        """
+        current = self.head.next[0]
+        while current is not None:
+            if current.fully_linked and not current.marked:
+                yield current.value
+            current = current.next[0]
 
 
+def _identity(value):
+    return value
+
 
 if __name__ == '__main__':
     # Example Usage
@@ -140,3 +754,29 @@ if __name__ == '__main__':
     # Deleting a value
     skip_list.delete(10)
     print("Skip List size after deletion:", len(skip_list))  # Output: 3
+
+    # Using the skip list as an ordered map
+    index = SkipList()
+    index["banana"] = 3
+    index["apple"] = 7
+    index["banana"] = 4
+    print("Value of 'banana':", index["banana"])  # Output: 4
+
+    # Ordering records by a key function
+    records = SkipList(key=lambda record: record[1])
+    records.insert(("bob", 31))
+    records.insert(("alice", 27))
+    print("Has a record aged 27:", records.search(("anyone", 27)))  # Output: True
+
+    # Ranking and paging
+    leaderboard = SkipList(key=lambda entry: -entry[1])
+    for entry in [("ann", 50), ("ben", 80), ("cid", 65), ("dee", 90)]:
+        leaderboard.insert(entry)
+    print("Position of cid:", leaderboard.rank(("cid", 65)))  # Output: 2
+    print("Top 2:", leaderboard[:2])  # Output: [('dee', 90), ('ben', 80)]
+
+    # Bulk loading sorted timestamps
+    timeline = SkipList.from_sorted(range(0, 100, 10))
+    timeline.insert_many([15, 25, 35])
+    print("Found 25 and 26:", timeline.search_many([25, 26]))  # Output: [True, False]
+    print("Deleted:", timeline.delete_many([10, 15, 20]))  # Output: 3
@@ -0,0 +1,7 @@
+"""
+Benchmarks for the data structures of this repository.
+
+Run from the repository root:
+
+    python -m benchmarks --sizes 1000,100000 --output results.json
+"""
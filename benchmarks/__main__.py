@@ -0,0 +1,117 @@
+import argparse
+import json
+import sys
+
+from .runner import compare, load_report, run
+from .suites import SUITES
+from .workloads import DISTRIBUTIONS
+
+
+def _csv(choices=None, convert=str):
+    def parse(text):
+        values = [convert(value) for value in text.split(",") if value]
+        if choices is not None:
+            for value in values:
+                if value not in choices:
+                    raise argparse.ArgumentTypeError(
+                        f"invalid choice {value!r} (choose from {', '.join(choices)})"
+                    )
+        return values
+
+    return parse
+
+
+def _size(text: str) -> int:
+    # Accepts 1000 as well as 1e3.
+    return int(float(text))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the data structures and report ops/sec, latency percentiles and peak memory as JSON.",
+    )
+    parser.add_argument(
+        "--structures", type=_csv(SUITES), default=list(SUITES),
+        help="comma separated suites (default: all)",
+    )
+    parser.add_argument(
+        "--workloads", type=_csv(DISTRIBUTIONS), default=list(DISTRIBUTIONS),
+        help="comma separated key distributions (default: all)",
+    )
+    parser.add_argument(
+        "--sizes", type=_csv(convert=_size), default=[1_000, 10_000, 100_000],
+        help="comma separated structure sizes, e.g. 1e3,1e5,1e7 (default: 1e3,1e4,1e5)",
+    )
+    parser.add_argument("--ops", type=int, default=10_000, help="timed operations per measurement")
+    parser.add_argument(
+        "--repeats", type=int, default=5,
+        help="timed rounds per measurement after a warm-up round (default: 5)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random workloads")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="relative throughput drop that counts as a regression (default: 0.10)",
+    )
+    parser.add_argument(
+        "--latency-threshold", type=float, default=None,
+        help="also flag a relative rise of the median p99 latency (default: off)",
+    )
+    parser.add_argument(
+        "--min-latency-delta", type=int, default=1_000,
+        help="smallest p99 rise in ns that --latency-threshold flags (default: 1000)",
+    )
+    parser.add_argument("--quiet", action="store_true", help="do not print progress to stderr")
+    args = parser.parse_args(argv)
+
+    report = run(
+        structures=args.structures,
+        distributions=args.workloads,
+        sizes=args.sizes,
+        operations=args.ops,
+        repeats=args.repeats,
+        seed=args.seed,
+        track_memory=not args.no_memory,
+        log=None if args.quiet else sys.stderr,
+    )
+
+    incomparable = None
+    if args.baseline:
+        try:
+            report["regressions"] = compare(
+                report,
+                load_report(args.baseline),
+                args.threshold,
+                args.latency_threshold,
+                args.min_latency_delta,
+            )
+        except ValueError as error:
+            incomparable = error
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    for name, reason in report["skipped"].items():
+        print(f"skipped {name}: {reason}", file=sys.stderr)
+    if incomparable is not None:
+        print(f"cannot compare with {args.baseline}: {incomparable}", file=sys.stderr)
+        return 2
+    regressions = report.get("regressions", [])
+    for regression in regressions:
+        print(
+            "REGRESSION {structure} {operation} {workload} n={size}: "
+            "{metric} {baseline} -> {current}".format(**regression),
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
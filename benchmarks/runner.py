@@ -0,0 +1,282 @@
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from .suites import SUITES, load_suite
+from .workloads import DISTRIBUTIONS, make_keys
+
+
+def percentile(sorted_values: list, fraction: float):
+    """Return the value below which 'fraction' of the sorted values lie (nearest rank)."""
+
+    if not sorted_values:
+        return 0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _timed(function, *args):
+    """Call function(*args) with the garbage collector paused, return the elapsed nanoseconds and its result."""
+
+    enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        value = function(*args)
+        return time.perf_counter_ns() - start, value
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def measure_round(suite, operation: str, size: int, keys: list) -> dict:
+    """
+    Time one round of an operation over every key, on fresh structures of 'size' items.
+
+    Throughput comes from timing the whole loop. Latency percentiles come from a
+    second structure on which every call is timed, so the clock reads do not
+    slow down the loop.
+
+    Return:
+        dict: The build, loop and p50/p99 latency timings in nanoseconds.
+    """
+
+    apply = suite.operations[operation]
+    clock = time.perf_counter_ns
+
+    def loop(structure):
+        for key in keys:
+            apply(structure, key)
+
+    def per_call(structure, latencies):
+        for key in keys:
+            start = clock()
+            apply(structure, key)
+            latencies.append(clock() - start)
+
+    build_ns, structure = _timed(suite.build, size)
+    loop_ns = _timed(loop, structure)[0]
+    del structure
+
+    latencies = []
+    _timed(per_call, suite.build(size), latencies)
+    latencies.sort()
+    return {
+        "build_ns": build_ns,
+        "loop_ns": loop_ns,
+        "p50_ns": percentile(latencies, 0.50),
+        "p99_ns": percentile(latencies, 0.99),
+    }
+
+
+def summarize(rounds: list, operations: int) -> dict:
+    """
+    Combine the rounds of one measurement.
+
+    Throughput keeps the best round, as timeit does, since slower rounds only
+    add noise from the rest of the machine; the median throughput is reported
+    as well. Build time and latency percentiles are medians over the rounds.
+
+    Return:
+        dict: The build time, throughput and p50/p99 latency.
+    """
+
+    def throughput(nanoseconds):
+        return operations / (nanoseconds / 1e9) if nanoseconds else float("inf")
+
+    loop_times = [round_["loop_ns"] for round_ in rounds]
+    return {
+        "build_seconds": statistics.median(round_["build_ns"] for round_ in rounds) / 1e9,
+        "ops_per_sec": throughput(min(loop_times)),
+        "ops_per_sec_median": throughput(statistics.median(loop_times)),
+        "p50_ns": statistics.median(round_["p50_ns"] for round_ in rounds),
+        "p99_ns": statistics.median(round_["p99_ns"] for round_ in rounds),
+    }
+
+
+def peak_memory(suite, operation: str, size: int, keys: list) -> int:
+    """Return the peak traced memory of building a structure and applying the operation to every key."""
+
+    apply = suite.operations[operation]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        structure = suite.build(size)
+        for key in keys:
+            apply(structure, key)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(
+    structures=None,
+    distributions=DISTRIBUTIONS,
+    sizes=(1_000, 10_000, 100_000),
+    operations: int = 10_000,
+    repeats: int = 5,
+    seed: int = 0,
+    track_memory: bool = True,
+    log=None,
+) -> dict:
+    """
+    Run every selected suite, operation, workload and size.
+
+    Parameters:
+        structures (iterable): Suite names, all of SUITES by default.
+        distributions (iterable): Workload names from workloads.DISTRIBUTIONS.
+        sizes (iterable): Number of items the structures hold.
+        operations (int): Number of timed calls per measurement.
+        repeats (int): Number of timed rounds per measurement, after one warm-up round.
+            Rounds are interleaved across measurements.
+        seed (int): Seed for the random workloads.
+        track_memory (bool): Whether to run the tracemalloc pass.
+        log (file): Where to print progress, nothing by default.
+
+    Return:
+        dict: A JSON-serializable report with the environment and one result per measurement.
+    """
+
+    report = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "operations": operations,
+            "repeats": repeats,
+            "seed": seed,
+        },
+        "results": [],
+        "skipped": {},
+    }
+
+    measurements = []
+    for name in structures or SUITES:
+        try:
+            suite = load_suite(name)
+        except ImportError as error:
+            report["skipped"][name] = str(error)
+            continue
+        for size in sizes:
+            for distribution in distributions:
+                keys = make_keys(distribution, size, operations, seed)
+                for operation in suite.operations:
+                    measurements.append((name, suite, operation, distribution, size, keys))
+
+    # One untimed warm-up round each, then the timed rounds sweep over every
+    # measurement in turn, so a burst of load on the machine hits one round of
+    # many measurements rather than every round of a few.
+    for _, suite, operation, _, size, keys in measurements:
+        measure_round(suite, operation, size, keys)
+    rounds = [[] for _ in measurements]
+    for _ in range(repeats):
+        for samples, (_, suite, operation, _, size, keys) in zip(rounds, measurements):
+            samples.append(measure_round(suite, operation, size, keys))
+
+    for samples, (name, suite, operation, distribution, size, keys) in zip(rounds, measurements):
+        result = summarize(samples, operations)
+        result["peak_memory_bytes"] = (
+            peak_memory(suite, operation, size, keys) if track_memory else None
+        )
+        result.update(structure=name, operation=operation, workload=distribution, size=size)
+        report["results"].append(result)
+        if log is not None:
+            print(
+                f"{name:>12} {operation:>12} {distribution:>11} n={size:<9}"
+                f" {result['ops_per_sec']:>12.0f} ops/s"
+                f" p50={result['p50_ns']}ns p99={result['p99_ns']}ns",
+                file=log,
+            )
+    return report
+
+
+def _result_key(result: dict) -> tuple:
+    return result["structure"], result["operation"], result["workload"], result["size"]
+
+
+# Environment fields that must match for two reports to be comparable.
+COMPARABLE_META = ("python", "implementation", "platform", "operations", "repeats", "seed")
+
+
+def mismatched_meta(report: dict, baseline: dict) -> list[str]:
+    """Return the COMPARABLE_META fields whose values differ between the two reports."""
+
+    return [
+        field
+        for field in COMPARABLE_META
+        if report["meta"].get(field) != baseline.get("meta", {}).get(field)
+    ]
+
+
+def compare(
+    report: dict,
+    baseline: dict,
+    threshold: float = 0.10,
+    latency_threshold: float = None,
+    min_latency_delta_ns: int = 1_000,
+) -> list[dict]:
+    """
+    Compare a report against a baseline report.
+
+    A measurement regresses when its best-of throughput drops by more than
+    'threshold' (a fraction) relative to the same measurement in the baseline.
+    Tail latency is too noisy to gate on by default: with 'latency_threshold'
+    set, the median p99 also regresses when it rises by more than that fraction
+    and by at least 'min_latency_delta_ns'. Measurements missing from either
+    report are ignored.
+
+    Raises:
+        ValueError: If the baseline was recorded with a different Python,
+            platform or workload settings, see COMPARABLE_META.
+
+    Return:
+        list: One entry per regression, with the metric and both values.
+    """
+
+    mismatched = mismatched_meta(report, baseline)
+    if mismatched:
+        raise ValueError(
+            "baseline is not comparable, it differs in: "
+            + ", ".join(
+                f"{field} ({baseline.get('meta', {}).get(field)!r} != {report['meta'].get(field)!r})"
+                for field in mismatched
+            )
+        )
+
+    previous = {_result_key(result): result for result in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        old = previous.get(_result_key(result))
+        if old is None:
+            continue
+        checks = [("ops_per_sec", result["ops_per_sec"] < old["ops_per_sec"] * (1 - threshold))]
+        if latency_threshold is not None:
+            rise = result["p99_ns"] - old["p99_ns"]
+            checks.append(
+                ("p99_ns", rise > old["p99_ns"] * latency_threshold and rise >= min_latency_delta_ns)
+            )
+        for metric, regressed in checks:
+            if regressed:
+                regressions.append(
+                    {
+                        "structure": result["structure"],
+                        "operation": result["operation"],
+                        "workload": result["workload"],
+                        "size": result["size"],
+                        "metric": metric,
+                        "baseline": old[metric],
+                        "current": result[metric],
+                    }
+                )
+    return regressions
+
+
+def load_report(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
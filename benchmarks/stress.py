@@ -0,0 +1,101 @@
+"""
+Concurrency stress test for SkipList.ConcurrentSkipList.
+
+    python -m benchmarks.stress --threads 8 --ops 20000
+"""
+
+import argparse
+import random
+import sys
+import threading
+
+
+def stress_test(skip_list=None, threads: int = 8, operations: int = 20_000, key_range: int = 1_000):
+    """
+    Run a mixed insert/delete/search workload on a ConcurrentSkipList from
+    several threads, then check that the list is still sorted, free of removed
+    nodes and consistent with its size.
+
+    Parameters:
+        skip_list (ConcurrentSkipList): The list to use, a new one by default.
+        threads (int): Number of worker threads.
+        operations (int): Number of operations per thread.
+        key_range (int): Keys are drawn from range(key_range), so threads collide.
+
+    Raises:
+        RuntimeError: If the list is left in an inconsistent state.
+
+    Return:
+        ConcurrentSkipList: The skip list after the workload.
+    """
+
+    from SkipList import ConcurrentSkipList
+
+    skip_list = skip_list if skip_list is not None else ConcurrentSkipList()
+    errors = []
+
+    def worker(seed):
+        rng = random.Random(seed)
+        try:
+            for _ in range(operations):
+                value = rng.randrange(key_range)
+                roll = rng.random()
+                if roll < 0.3:
+                    skip_list.insert(value)
+                elif roll < 0.5:
+                    skip_list.delete(value)
+                else:
+                    skip_list.search(value)
+        except Exception as error:
+            errors.append(error)
+
+    workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+    for level in range(skip_list.maxLevel + 1):
+        previous = skip_list.head
+        current = previous.next[level]
+        while current is not None:
+            if current.marked:
+                raise RuntimeError(f"removed node {current.value!r} still linked at level {level}")
+            if previous is not skip_list.head and not previous.key < current.key:
+                raise RuntimeError(
+                    f"keys out of order at level {level}: {previous.value!r} before {current.value!r}"
+                )
+            previous, current = current, current.next[level]
+
+    values = list(skip_list)
+    if len(values) != len(skip_list):
+        raise RuntimeError(f"size is {len(skip_list)} but {len(values)} nodes are linked")
+    missing = [value for value in values if not skip_list.search(value)]
+    if missing:
+        raise RuntimeError(f"linked values not found by search: {missing[:10]!r}")
+    return skip_list
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.stress",
+        description="Hammer a ConcurrentSkipList from several threads and check its invariants.",
+    )
+    parser.add_argument("--threads", type=int, default=8, help="worker threads (default: 8)")
+    parser.add_argument("--ops", type=int, default=20_000, help="operations per thread (default: 20000)")
+    parser.add_argument("--keys", type=int, default=1_000, help="size of the key range (default: 1000)")
+    args = parser.parse_args(argv)
+
+    try:
+        skip_list = stress_test(threads=args.threads, operations=args.ops, key_range=args.keys)
+    except RuntimeError as error:
+        print(f"FAILED: {error}", file=sys.stderr)
+        return 1
+    print(f"ok: {len(skip_list)} values after {args.threads * args.ops} operations")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
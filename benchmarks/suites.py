@@ -0,0 +1,133 @@
+"""
+The structures under benchmark.
+
+A suite builds a structure holding 'n' items and names the operations to time
+on it. Every operation is called as operation(structure, key) with the keys of
+a workload (see workloads.make_keys), all in [0, n).
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+@dataclass
+class Suite:
+    name: str
+    build: Callable[[int], object]
+    operations: dict[str, Callable[[object, int], object]] = field(default_factory=dict)
+
+
+def _fenwick_suite() -> Suite:
+    from FenwickTree import FenwickTree
+
+    return Suite(
+        "fenwick_tree",
+        lambda n: FenwickTree.from_array([1] * n),
+        {
+            "update": lambda tree, key: tree.update(key + 1, 1),
+            "query": lambda tree, key: tree.query(key + 1),
+            "range_query": lambda tree, key: tree.range_query(key // 2 + 1, key + 1),
+        },
+    )
+
+
+def _disjoint_set_suite() -> Suite:
+    from disjoint_set import DisjointSet
+
+    # Consecutive keys of the adversarial and sequential workloads link elements
+    # into long chains, the worst case for find without compression.
+    return Suite(
+        "disjoint_set",
+        DisjointSet,
+        {
+            "union": lambda sets, key: sets.union(key, (key + 1) % len(sets.parent)),
+            "find": lambda sets, key: sets.find(key),
+        },
+    )
+
+
+def _bloom_filter_suite() -> Suite:
+    from bloomfilter import BloomFilter
+
+    def build(n):
+        bloomf = BloomFilter(n, 0.01)
+        bloomf.add_many([str(key) for key in range(0, 2 * n, 2)])
+        return bloomf
+
+    return Suite(
+        "bloom_filter",
+        build,
+        {
+            "add": lambda bloomf, key: bloomf.add(str(key)),
+            "contains": lambda bloomf, key: str(key) in bloomf,
+        },
+    )
+
+
+def _splay_tree_suite() -> Suite:
+    from splaytree import SplayTree
+
+    return Suite(
+        "splay_tree",
+        lambda n: SplayTree.from_sorted(range(0, 2 * n, 2)),
+        {
+            "search": lambda tree, key: tree.search(key),
+            "insert": lambda tree, key: tree.insert(key),
+            "rank": lambda tree, key: tree.rank(key),
+        },
+    )
+
+
+def _trie_suite() -> Suite:
+    from trie import Trie
+
+    def build(n):
+        trie = Trie()
+        trie.insert_many(sorted(f"{key:08x}" for key in range(0, 2 * n, 2)))
+        return trie
+
+    return Suite(
+        "trie",
+        build,
+        {
+            "insert": lambda trie, key: trie.insert(f"{key:08x}"),
+            "search": lambda trie, key: trie.search(f"{key:08x}"),
+            "iter_prefix": lambda trie, key: list(trie.iter_prefix(f"{key:08x}"[:5], limit=10)),
+        },
+    )
+
+
+def _skip_list_suite() -> Suite:
+    from SkipList import SkipList
+
+    return Suite(
+        "skip_list",
+        lambda n: SkipList.from_sorted(range(0, 2 * n, 2)),
+        {
+            "search": lambda skip_list, key: skip_list.search(key),
+            "insert": lambda skip_list, key: skip_list.insert(key),
+            "delete": lambda skip_list, key: skip_list.delete(key),
+            "select": lambda skip_list, key: skip_list.select(key % len(skip_list)),
+        },
+    )
+
+
+SUITES = {
+    "fenwick_tree": _fenwick_suite,
+    "disjoint_set": _disjoint_set_suite,
+    "bloom_filter": _bloom_filter_suite,
+    "splay_tree": _splay_tree_suite,
+    "trie": _trie_suite,
+    "skip_list": _skip_list_suite,
+}
+
+
+def load_suite(name: str) -> Suite:
+    """
+    Import the structure of a suite and return it.
+
+    Raise ImportError when an optional dependency of the structure (such as mmh3
+    or bitarray for the bloom filter) is not installed.
+    """
+
+    return SUITES[name]()
@@ -0,0 +1,49 @@
+import itertools
+import random
+
+DISTRIBUTIONS = ("uniform", "zipf", "sequential", "adversarial")
+ZIPF_SUPPORT = 1_000_000
+
+
+def make_keys(distribution: str, n: int, count: int, seed: int = 0) -> list[int]:
+    """
+    Generate the keys an operation is applied to.
+
+    Parameters:
+        distribution (str): One of DISTRIBUTIONS.
+            uniform: keys drawn uniformly from [0, n).
+            zipf: a few hot keys take most of the accesses (exponent 1.1).
+            sequential: monotonically increasing keys, wrapping around at n.
+            adversarial: alternating extremes 0, n-1, 1, n-2, ..., which defeats
+                locality (splaying, fingers) and caching.
+        n (int): The size of the key space.
+        count (int): The number of keys to generate.
+        seed (int): Seed for the random distributions.
+
+    Return:
+        list: The generated keys.
+    """
+
+    rng = random.Random(seed)
+    if distribution == "uniform":
+        return [rng.randrange(n) for _ in range(count)]
+    if distribution == "zipf":
+        return zipf_keys(rng, n, count)
+    if distribution == "sequential":
+        return [i % n for i in range(count)]
+    if distribution == "adversarial":
+        alternating = itertools.chain.from_iterable(zip(range(n), range(n - 1, -1, -1)))
+        return list(itertools.islice(itertools.cycle(alternating), count))
+    raise ValueError(f"Unknown distribution {distribution!r}.")
+
+
+def zipf_keys(rng: random.Random, n: int, count: int, exponent: float = 1.1) -> list[int]:
+    """
+    Draw keys from [0, n) where the k-th hottest key has a weight of 1 / (k + 1)^exponent.
+    Only the 10^6 hottest keys are modelled, the tail beyond them is negligible.
+    The hot keys are scattered over the key space by a multiplicative hash.
+    """
+
+    support = min(n, ZIPF_SUPPORT)
+    cumulative = list(itertools.accumulate(1 / (k + 1) ** exponent for k in range(support)))
+    return [k * 1_000_003 % n for k in rng.choices(range(support), cum_weights=cumulative, k=count)]
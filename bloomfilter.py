@@ -1,9 +1,89 @@
 import math
+import mmap
+import multiprocessing
+import struct
 import mmh3
 from bitarray import bitarray
 import random
 
-class BloomFilter:
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the batch methods fall back to plain loops.
+    np = None
+
+class _DoubleHashing:
+    """
+    Sizing and hashing shared by the filters that map an item to
+    hash_count positions out of size (BloomFilter, CountingBloomFilter).
+    """
+
+    @classmethod
+    def get_size(self,n,p):
+        """
+        Return m, the size of the bit array computed with the formula.
+        m = -(n*ln(p))/(ln(2)^2)
+        n: int
+            number of items expected to be stored in filter
+        p: float 
+            False positivie probability.
+        """
+        m = -(n*math.log(p))/(math.log(2)**2)
+        return int(m)
+
+
+    @classmethod
+    def get_hash_count(self,m,n):
+        """
+        Return the number of hash function needed using the formula:
+            k = m/n*ln(2)
+        """
+
+        k = (m/n)*math.log(2)
+        return int(k)
+
+    def estimated_fp_prob(self):
+        """
+        Return the expected false positive probability after 'count' insertions:
+            p = (1 - e^(-k*n/m))^k
+        """
+        return (1 - math.exp(-self.hash_count*self.count/self.size))**self.hash_count
+    
+    def get_positions(self,item):
+        """
+        Return the hash_count positions of an item.
+
+        A single 128-bit murmur hash is split into two halves h1 and h2 and
+        the positions are derived by double hashing (Kirsch-Mitzenmacher):
+            g_i = (h1 + i*h2) mod m
+        h2 is kept in [1, m-1], a zero step would put every position on h1.
+        """
+        h1,h2 = mmh3.hash64(item,signed=False)
+        h1 %= self.size
+        h2 = h2 % max(1,self.size-1) + 1
+        return [(h1 + i*h2) % self.size for i in range(self.hash_count)]
+
+    def get_positions_many(self,items):
+        """
+        Return the positions of several items as a (len(items), hash_count)
+        NumPy array, using the same double hashing as get_positions.
+        """
+        hashes = np.array([mmh3.hash64(item,signed=False) for item in items],dtype=np.uint64)
+        hashes = hashes.reshape(-1,2)
+        h1 = hashes[:,:1] % np.uint64(self.size)
+        h2 = hashes[:,1:] % np.uint64(max(1,self.size-1)) + np.uint64(1)
+        steps = np.arange(self.hash_count,dtype=np.uint64)
+        return (h1 + steps*h2) % np.uint64(self.size)
+
+
+class BloomFilter(_DoubleHashing):
+
+    # File layout: magic, size, hash_count, fp_prob, hash scheme, count, then the raw bits.
+    # The last two magic bytes are the format version, bumped whenever the header changes.
+    MAGIC = b'BLOOMF02'
+    HEADER = struct.Struct('<8sQQdQQ')
+    # 1: one 128-bit murmur3 hash per item with Kirsch-Mitzenmacher double hashing.
+    # 2: as 1, with the step h2 kept non-zero.
+    HASH_SCHEME = 2
 
     def __init__(self,items_size,fp_prob):
         """
@@ -20,55 +100,624 @@ class BloomFilter:
 
         self.hash_count = self.get_hash_count(self.size,items_size)
 
-        self.bit_array = bitarray(self.size)
+        self.bit_array = bitarray(self.size, endian='big')
 
         self.bit_array.setall(0)
 
+        self.count = 0
+
+    def save(self,path):
+        """
+        Write the filter to 'path' so it can be loaded back with BloomFilter.open.
+        """
+        with open(path,'wb') as file:
+            file.write(self.HEADER.pack(self.MAGIC,self.size,self.hash_count,self.fp_prob,self.HASH_SCHEME,self.count))
+            file.write(self.bit_array.tobytes())
 
     @classmethod
-    def get_size(self,n,p):
+    def open(cls,path,mode='r'):
         """
-        Return m, the size of the bit array computed with the formula.
-        m = -(n*ln(p))/(ln(2)^2)
-        n: int
-            number of items expected to be stored in filter
-        p: float 
-            False positivie probability.
+        Load a filter saved with save() by memory-mapping its file.
+
+        The bit array is not copied, so every process opening the same file
+        shares one page-cached copy.
+
+        mode: str
+            'r'  read-only, adding items raises an error.
+            'r+' read-write, added items are written back to the file.
+            'c'  copy-on-write, added items stay private to this process.
         """
-        m = -(n*math.log(p))/(math.log(2)**2)
-        return int(m)
+        access = {'r':mmap.ACCESS_READ,'r+':mmap.ACCESS_WRITE,'c':mmap.ACCESS_COPY}
+        if mode not in access:
+            raise ValueError("mode must be one of 'r', 'r+' or 'c'.")
+
+        with open(path,'r+b' if mode == 'r+' else 'rb') as file:
+            buffer = mmap.mmap(file.fileno(),0,access=access[mode])
 
+        if len(buffer) < cls.HEADER.size:
+            buffer.close()
+            raise ValueError("{} is not a saved bloom filter.".format(path))
+        magic,size,hash_count,fp_prob,hash_scheme,count = cls.HEADER.unpack_from(buffer)
+        if magic != cls.MAGIC:
+            buffer.close()
+            if magic[:6] == cls.MAGIC[:6]:
+                raise ValueError("{} uses bloom filter format {}, expected {}.".format(
+                    path,magic[6:].decode('ascii','replace'),cls.MAGIC[6:].decode('ascii')))
+            raise ValueError("{} is not a saved bloom filter.".format(path))
+        if hash_scheme != cls.HASH_SCHEME:
+            buffer.close()
+            raise ValueError("Unsupported hash scheme {}.".format(hash_scheme))
+        if len(buffer) < cls.HEADER.size + (size+7)//8:
+            buffer.close()
+            raise ValueError("{} is truncated, it should hold {} bits.".format(path,size))
+
+        # The view is rounded up to whole bytes, positions never reach the padding.
+        bit_array = bitarray(buffer=memoryview(buffer)[cls.HEADER.size:],endian='big')
+        bloomf = cls.from_bits(bit_array,size,hash_count,fp_prob,count)
+        bloomf._mmap = buffer
+        bloomf._mode = mode
+        return bloomf
 
     @classmethod
-    def get_hash_count(self,m,n):
+    def from_bits(cls,bit_array,size,hash_count,fp_prob,count=0):
         """
-        Return the number of hash function needed using the formula:
-            k = m/n*ln(2)
+        Create a filter around an existing bit array, without resizing it.
         """
+        bloomf = cls.__new__(cls)
+        bloomf.fp_prob = fp_prob
+        bloomf.size = size
+        bloomf.hash_count = hash_count
+        bloomf.count = count
+        bloomf.bit_array = bit_array
+        return bloomf
+
+    def close(self):
+        """
+        Release the memory map of a filter loaded with BloomFilter.open.
+        In 'r+' mode the insertion count is written back to the header first.
+        Raise BufferError, leaving the filter open, while other references to
+        its bit_array still point into the map.
+        """
+        buffer = getattr(self,'_mmap',None)
+        if buffer is not None:
+            if self._mode == 'r+':
+                struct.pack_into('<Q',buffer,self.HEADER.size - 8,self.count)
+            mapped = self.bit_array
+            self.bit_array = bitarray(mapped)
+            del mapped
+            try:
+                buffer.close()
+            except BufferError:
+                self.bit_array = bitarray(buffer=memoryview(buffer)[self.HEADER.size:],endian='big')
+                raise
+            self._mmap = None
 
-        k = (m/n)*math.log(2)
-        return int(k)
-    
     def add(self,item):
         """
         Add a item to the filter.
         """
-        for i in range(self.hash_count):
-            hash_poz = mmh3.hash(item,i)%self.size
+        for hash_poz in self.get_positions(item):
             self.bit_array[hash_poz] = 1
+        self.count += 1
 
     def __contains__(self,item):
         """
             Check if the item might be in the filter.
         """
-        for i in range(self.hash_count):
-            hash_poz = mmh3.hash(item,i) % self.size
+        for hash_poz in self.get_positions(item):
             if self.bit_array[hash_poz] == 0:
                 return False
         return True
+
+    def add_many(self,items):
+        """
+        Add several items to the filter.
+
+        With NumPy the positions are computed for the whole batch and set
+        directly on the bytes backing the bit array.
+        """
+        if np is None:
+            for item in items:
+                self.add(item)
+            return
+
+        octets = self._writable_octets()
+        positions = self.get_positions_many(items)
+        masks = (np.uint64(0x80) >> (positions & np.uint64(7))).astype(np.uint8)
+        np.bitwise_or.at(octets,positions >> np.uint64(3),masks)
+        self.count += len(positions)
+
+    def _writable_octets(self):
+        """
+        Return a NumPy view of the bytes backing the bit array, for writing.
+
+        NumPy's ufunc.at ignores the read-only flag of the view, so a filter
+        opened in 'r' mode is refused here with the TypeError add() raises,
+        rather than writing into a read-only memory map.
+        """
+        if self.bit_array.readonly:
+            raise TypeError("cannot modify read-only memory")
+        return np.frombuffer(self.bit_array,dtype=np.uint8)
+
+    def contains_many(self,items):
+        """
+        Check several items at once.
+
+        Return a boolean mask (a NumPy array, or a list without NumPy) that is
+        True where the item might be in the filter.
+        """
+        if np is None:
+            return [item in self for item in items]
+
+        positions = self.get_positions_many(items)
+        octets = np.frombuffer(self.bit_array,dtype=np.uint8)[positions >> np.uint64(3)]
+        bits = (octets >> (np.uint64(7) - (positions & np.uint64(7))).astype(np.uint8)) & 1
+        return bits.all(axis=1)
+
+    def estimated_cardinality(self):
+        """
+        Return the approximate number of distinct items in the filter, from
+        the fraction X/m of bits that are set:
+            n = -(m/k)*ln(1 - X/m)
+        """
+        ones = self.bit_array.count(1)
+        if ones >= self.size:
+            return math.inf
+        return -(self.size/self.hash_count)*math.log(1 - ones/self.size)
+
+    def _check_compatible(self,other):
+        # Only plain bit-array filters can be combined, CountingBloomFilter and
+        # CuckooFilter store counters or fingerprints instead.
+        if not isinstance(other,BloomFilter) or not hasattr(other,'bit_array'):
+            raise TypeError("Cannot combine a BloomFilter with a {}.".format(type(other).__name__))
+        if (self.size,self.hash_count) != (other.size,other.hash_count):
+            raise ValueError("Bloom filters must have the same size and hash_count to be combined.")
+
+    def _combine(self,bit_array):
+        """
+        Return a new filter with this filter's parameters over 'bit_array'.
+        """
+        bloomf = BloomFilter.from_bits(bit_array,self.size,self.hash_count,self.fp_prob)
+        # The item count of a combined filter is unknown, estimate it from the bits.
+        bloomf.count = round(min(bloomf.estimated_cardinality(),self.size))
+        return bloomf
+
+    def union(self,other):
+        """
+        Return a filter holding the items of both filters.
+        The result is exactly the filter that adding both item sets would give.
+        """
+        self._check_compatible(other)
+        return self._combine(self.bit_array[:self.size] | other.bit_array[:other.size])
+
+    def intersection(self,other):
+        """
+        Return a filter holding the items present in both filters. It can have a
+        higher false positive probability than a filter built from the
+        common items alone.
+        """
+        self._check_compatible(other)
+        return self._combine(self.bit_array[:self.size] & other.bit_array[:other.size])
+
+    def __or__(self,other):
+        return self.union(other)
+
+    def __and__(self,other):
+        return self.intersection(other)
+
+    @classmethod
+    def build_parallel(cls,items,items_size,fp_prob,processes=None):
+        """
+        Build a filter from a sequence of items using a process pool.
+
+        The items are split into one shard per process, each worker fills a
+        filter of identical size and hash_count, and the bit arrays are then
+        ORed together.
+
+        processes: int
+            Number of worker processes, defaults to the number of CPUs.
+        """
+        bloomf = cls(items_size,fp_prob)
+        processes = processes or multiprocessing.cpu_count()
+        shard_size = max(1,math.ceil(len(items)/processes))
+        shards = [(bloomf.size,bloomf.hash_count,fp_prob,items[start:start+shard_size])
+                  for start in range(0,len(items),shard_size)]
+
+        with multiprocessing.Pool(min(processes,len(shards)) or 1) as pool:
+            for shard in pool.imap_unordered(_build_shard,shards):
+                bloomf.bit_array |= shard.bit_array
+                bloomf.count += shard.count
+        return bloomf
         
 
 
+def _build_shard(args):
+    """
+    Fill an empty filter with one shard of items, for BloomFilter.build_parallel.
+    """
+    size,hash_count,fp_prob,items = args
+    bit_array = bitarray(size,endian='big')
+    bit_array.setall(0)
+    bloomf = BloomFilter.from_bits(bit_array,size,hash_count,fp_prob)
+    bloomf.add_many(items)
+    return bloomf
+
+
+class ScalableBloomFilter:
+
+    def __init__(self,initial_size,fp_prob,growth=2,tightening=0.5):
+        """
+        A bloom filter that keeps its false positive probability when more
+        items than expected are inserted, by chaining BloomFilter stages.
+
+        Stage i holds initial_size*growth^i items at a false positive
+        probability of fp_prob*(1-tightening)*tightening^i, so the compound
+        probability over all stages stays below fp_prob.
+
+        initial_size : int
+            Number of items the first stage is sized for.
+
+        fp_prob: float
+            The false positive probability to hold overall.
+
+        growth: int
+            How much larger each new stage is than the previous one.
+
+        tightening: float
+            Ratio between the false positive probability of consecutive stages.
+        """
+
+        self.fp_prob = fp_prob
+        self.growth = growth
+        self.tightening = tightening
+        self.count = 0
+        self.stages = []
+        self.capacities = []
+        self._add_stage(initial_size)
+
+    def __len__(self):
+        return self.count
+
+    def _add_stage(self,capacity):
+        """
+        Append a new, empty stage sized for 'capacity' items.
+        """
+        stage_fp_prob = self.fp_prob*(1-self.tightening)*self.tightening**len(self.stages)
+        self.stages.append(BloomFilter(capacity,stage_fp_prob))
+        self.capacities.append(capacity)
+
+    def _stage_for_insert(self):
+        """
+        Return the stage new items go to, opening a new one when the last is full.
+        """
+        if self.stages[-1].count >= self.capacities[-1]:
+            self._add_stage(self.capacities[-1]*self.growth)
+        return self.stages[-1]
+
+    def add(self,item):
+        """
+        Add a item to the filter. Items that are probably present already are
+        skipped, so they do not fill the current stage.
+        """
+        if item in self:
+            return
+        self._stage_for_insert().add(item)
+        self.count += 1
+
+    def __contains__(self,item):
+        """
+            Check if the item might be in the filter.
+        """
+        # Newer stages are larger and hold most of the items.
+        return any(item in stage for stage in reversed(self.stages))
+
+    def add_many(self,items):
+        """
+        Add several items to the filter, filling each stage in one batch.
+        Like add(), repeated and probably present items are only counted once.
+        """
+        items = list(dict.fromkeys(items))
+        while items:
+            stage = self._stage_for_insert()
+            batch = items[:self.capacities[-1]-stage.count]
+            items = items[len(batch):]
+            batch = [item for item,present in zip(batch,self.contains_many(batch)) if not present]
+            stage.add_many(batch)
+            self.count += len(batch)
+
+    def contains_many(self,items):
+        """
+        Check several items at once, see BloomFilter.contains_many.
+        """
+        items = list(items)
+        found = self.stages[0].contains_many(items)
+        for stage in self.stages[1:]:
+            if np is None:
+                found = [a or b for a,b in zip(found,stage.contains_many(items))]
+            else:
+                found = found | stage.contains_many(items)
+        return found
+
+    def estimated_fp_prob(self):
+        """
+        Return the current false positive probability, combined over all stages:
+            p = 1 - prod(1 - p_i)
+        """
+        return 1 - math.prod(1-stage.estimated_fp_prob() for stage in self.stages)
+
+
+class CountingBloomFilter(_DoubleHashing):
+
+    # Counters saturate here and are never decremented again afterwards.
+    MAX_COUNT = 15
+
+    def __init__(self,items_size,fp_prob):
+        """
+        A bloom filter that supports remove(), using a 4-bit counter per slot
+        instead of a single bit. Sized exactly like BloomFilter.
+
+        items_size : int
+            Number of items expected to be stored in bloom filter.
+
+        fp_prob: float
+            The false positive probability.
+        """
+
+        self.fp_prob = fp_prob
+
+        self.size = self.get_size(items_size,fp_prob)
+
+        self.hash_count = self.get_hash_count(self.size,items_size)
+
+        # Two counters per byte, slot i lives in the low nibble when i is even.
+        self.counters = bytearray((self.size+1)//2)
+
+        self.count = 0
+
+    def get_counter(self,position):
+        """
+        Return the counter of a slot.
+        """
+        return (self.counters[position >> 1] >> ((position & 1) << 2)) & 0xF
+
+    def _step_counter(self,position,delta):
+        """
+        Add delta (1 or -1) to the counter of a slot, unless it is saturated.
+        """
+        value = self.get_counter(position)
+        if value == self.MAX_COUNT:
+            return
+        shift = (position & 1) << 2
+        self.counters[position >> 1] += delta << shift
+
+    def add(self,item):
+        """
+        Add a item to the filter.
+        """
+        for hash_poz in self.get_positions(item):
+            self._step_counter(hash_poz,1)
+        self.count += 1
+
+    def remove(self,item):
+        """
+        Remove a item that was previously added to the filter.
+        Raise KeyError if the item is definitely not in the filter.
+        """
+        positions = self.get_positions(item)
+        if any(self.get_counter(hash_poz) == 0 for hash_poz in positions):
+            raise KeyError(item)
+        for hash_poz in positions:
+            self._step_counter(hash_poz,-1)
+        self.count -= 1
+
+    def __contains__(self,item):
+        """
+            Check if the item might be in the filter.
+        """
+        for hash_poz in self.get_positions(item):
+            if self.get_counter(hash_poz) == 0:
+                return False
+        return True
+
+    def add_many(self,items):
+        """
+        Add several items to the filter.
+        """
+        for item in items:
+            self.add(item)
+
+    def contains_many(self,items):
+        """
+        Check several items at once, see BloomFilter.contains_many.
+        """
+        return [item in self for item in items]
+
+
+class CuckooFilter:
+
+    BUCKET_SIZE = 4
+    MAX_KICKS = 500
+    # Fraction of the slots expected to be used when items_size items are stored.
+    LOAD_FACTOR = 0.95
+
+    def __init__(self,items_size,fp_prob):
+        """
+        A filter that supports remove() and stores one small fingerprint per
+        item in one of two candidate buckets. A lookup reads at most two
+        buckets of BUCKET_SIZE adjacent slots.
+
+        Fingerprints are packed at fingerprint_bits each, about
+        (log2(1/p)+3)/0.95 bits per item against 1.44*log2(1/p) for a bloom
+        filter, so it only uses less space below p of roughly 0.003.
+
+        items_size : int
+            Number of items expected to be stored in the filter.
+
+        fp_prob: float
+            The false positive probability.
+        """
+
+        self.fp_prob = fp_prob
+
+        self.fingerprint_bits = self.get_fingerprint_bits(self.BUCKET_SIZE,fp_prob)
+
+        self.bucket_count = self.get_bucket_count(items_size,self.BUCKET_SIZE,self.LOAD_FACTOR)
+
+        self.size = self.bucket_count*self.BUCKET_SIZE
+
+        # Slot i holds bits [i*f, (i+1)*f) of a little-endian bit string, a
+        # fingerprint of 0 marks an empty slot. The spare bytes let a read of
+        # the last slot go past its end.
+        self.slots = bytearray((self.size*self.fingerprint_bits + 7)//8 + 8)
+
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    @classmethod
+    def get_fingerprint_bits(self,b,p):
+        """
+        Return f, the fingerprint length in bits, from the formula:
+            f = log2(2*b/p)
+        b: int
+            number of slots per bucket
+        p: float
+            False positivie probability.
+        """
+        return max(1,math.ceil(math.log2(2*b/p)))
+
+    @classmethod
+    def get_bucket_count(self,n,b,load_factor):
+        """
+        Return the number of buckets needed to hold n items at load_factor.
+        """
+        return max(1,math.ceil(n/(b*load_factor)))
+
+    def get_candidates(self,item):
+        """
+        Return the fingerprint and the two candidate buckets of an item.
+        """
+        h1,h2 = mmh3.hash64(item,signed=False)
+        fingerprint = h2 % ((1 << self.fingerprint_bits)-1) + 1
+        index = h1 % self.bucket_count
+        return fingerprint,index,self.get_alternate(index,fingerprint)
+
+    def get_alternate(self,index,fingerprint):
+        """
+        Return the other bucket of a fingerprint stored in bucket 'index'.
+            i2 = (hash(fingerprint) - i1) mod buckets
+        Applying it twice gives back i1, for any number of buckets.
+        """
+        return ((fingerprint*0x5bd1e995) - index) % self.bucket_count
+
+    def _read(self,position,width):
+        """
+        Return 'width' bits of slots starting at bit 'position'.
+        """
+        start = position >> 3
+        chunk = int.from_bytes(self.slots[start:start + ((position & 7) + width + 7)//8],'little')
+        return (chunk >> (position & 7)) & ((1 << width)-1)
+
+    def get_slot(self,position):
+        """
+        Return the fingerprint held by a slot.
+        """
+        return self._read(position*self.fingerprint_bits,self.fingerprint_bits)
+
+    def set_slot(self,position,fingerprint):
+        """
+        Store a fingerprint (or 0 to clear it) in a slot.
+        """
+        offset = position*self.fingerprint_bits
+        start = offset >> 3
+        shift = offset & 7
+        end = start + (shift + self.fingerprint_bits + 7)//8
+        chunk = int.from_bytes(self.slots[start:end],'little')
+        chunk &= ~(((1 << self.fingerprint_bits)-1) << shift)
+        self.slots[start:end] = (chunk | (fingerprint << shift)).to_bytes(end-start,'little')
+
+    def _find_slot(self,index,fingerprint):
+        """
+        Return the position of fingerprint in bucket 'index', or -1.
+        """
+        bits = self.fingerprint_bits
+        mask = (1 << bits)-1
+        # Read the whole bucket at once and scan its slots with shifts.
+        bucket = self._read(index*self.BUCKET_SIZE*bits,self.BUCKET_SIZE*bits)
+        for slot in range(self.BUCKET_SIZE):
+            if (bucket >> (slot*bits)) & mask == fingerprint:
+                return index*self.BUCKET_SIZE + slot
+        return -1
+
+    def add(self,item):
+        """
+        Add a item to the filter.
+        Raise RuntimeError, leaving the filter unchanged, if it is too full.
+        """
+        fingerprint,index1,index2 = self.get_candidates(item)
+        for index in (index1,index2):
+            position = self._find_slot(index,0)
+            if position != -1:
+                self.set_slot(position,fingerprint)
+                self.count += 1
+                return
+
+        # Both buckets are full: evict a random fingerprint to its other bucket.
+        index = random.choice((index1,index2))
+        evictions = []
+        for _ in range(self.MAX_KICKS):
+            position = index*self.BUCKET_SIZE + random.randrange(self.BUCKET_SIZE)
+            evicted = self.get_slot(position)
+            evictions.append((position,evicted))
+            self.set_slot(position,fingerprint)
+            fingerprint = evicted
+            index = self.get_alternate(index,fingerprint)
+            free = self._find_slot(index,0)
+            if free != -1:
+                self.set_slot(free,fingerprint)
+                self.count += 1
+                return
+
+        for position,previous in reversed(evictions):
+            self.set_slot(position,previous)
+        raise RuntimeError("Cuckoo filter is full.")
+
+    def remove(self,item):
+        """
+        Remove a item that was previously added to the filter.
+        Raise KeyError if the item is definitely not in the filter.
+        """
+        fingerprint,index1,index2 = self.get_candidates(item)
+        for index in (index1,index2):
+            position = self._find_slot(index,fingerprint)
+            if position != -1:
+                self.set_slot(position,0)
+                self.count -= 1
+                return
+        raise KeyError(item)
+
+    def __contains__(self,item):
+        """
+            Check if the item might be in the filter.
+        """
+        fingerprint,index1,index2 = self.get_candidates(item)
+        return self._find_slot(index1,fingerprint) != -1 or self._find_slot(index2,fingerprint) != -1
+
+    def add_many(self,items):
+        """
+        Add several items to the filter.
+        """
+        for item in items:
+            self.add(item)
+
+    def contains_many(self,items):
+        """
+        Check several items at once.
+        """
+        return [item in self for item in items]
+
+
 if __name__ == '__main__':
     n = 20
     p = 0.05
@@ -102,4 +751,18 @@ if __name__ == '__main__':
                 print("'{}' is probably present!".format(word))
         else:
             print("'{}' is definitely not present!".format(word))
-    
\ No newline at end of file
+
+    scalable = ScalableBloomFilter(10,0.05)
+    scalable.add_many(word_present)
+    print("Stages after {} items:{}".format(len(scalable),len(scalable.stages)))
+    print("Estimated false positive probability:{:.4f}".format(scalable.estimated_fp_prob()))
+
+    counting = CountingBloomFilter(n,p)
+    counting.add_many(word_present)
+    counting.remove('bloom')
+    print("'bloom' after removal from counting filter:{}".format('bloom' in counting))
+
+    cuckoo = CuckooFilter(n,p)
+    cuckoo.add_many(word_present)
+    cuckoo.remove('bloom')
+    print("'bloom' after removal from cuckoo filter:{}".format('bloom' in cuckoo))
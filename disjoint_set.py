@@ -1,3 +1,11 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the batch methods fall back to plain loops.
+    np = None
+
+
 class DisjointSet:
     def __init__(self,n:int):
         """
@@ -7,12 +15,20 @@ class DisjointSet:
             n (int): The number of elements in the set disjoined set.
         """
         
-        self.parent = list(range(n))
-        self.rank = [1] * n
+        self.parent = array('i', range(n))
+        self.rank = array('i', [1]) * n
+        # Only meaningful at roots: the number of elements in the set.
+        self.set_size = array('i', [1]) * n
+        # Circular sibling links, each set's members form one ring.
+        self.next = array('i', range(n))
+        self.component_count = n
     
     def find(self,x:int) -> int:
         """
-        Find the root of the set containing the element 'x', with path compression.
+        Find the root of the set containing the element 'x', with path halving.
+
+        Every visited node is pointed to its grandparent, which gives the same
+        amortized bound as full path compression without recursion.
 
         Parameters:
             x (int): The element whoes set representative is to be found.
@@ -21,9 +37,11 @@ class DisjointSet:
             int: The root of the set containing 'x'.
         """
 
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
     def union(self,x:int,y:int):
         """
@@ -39,13 +57,449 @@ class DisjointSet:
 
         if rootX != rootY:
             if self.rank[rootX] > self.rank[rootY]:
-                self.parent[rootY] = rootX
+                self._link(rootX, rootY)
             elif self.rank[rootX] < self.rank[rootY]:
-                self.parent[rootX] = rootY
+                self._link(rootY, rootX)
             else:
-                self.parent[rootY] = rootX
+                self._link(rootX, rootY)
                 self.rank[rootX] += 1
 
+    def _link(self,root:int,child:int):
+        """
+        Attach the root 'child' under 'root' and update the component bookkeeping.
+        Swapping the two 'next' links splices both member rings into one.
+        """
+
+        self.parent[child] = root
+        self.set_size[root] += self.set_size[child]
+        self.next[root], self.next[child] = self.next[child], self.next[root]
+        self.component_count -= 1
+
+    def size(self,x:int) -> int:
+        """
+        Return the number of elements in the set containing 'x'.
+
+        Parameters:
+            x (int): The element whose set size is wanted.
+
+        Return:
+            int: The size of the set containing 'x'.
+        """
+
+        return self.set_size[self.find(x)]
+
+    def members(self,x:int):
+        """
+        Iterate over the elements of the set containing 'x' in O(set size).
+
+        Parameters:
+            x (int): Any element of the set.
+
+        Return:
+            generator: The elements of the set, starting with 'x'.
+        """
+
+        next_link = self.next
+        current = x
+        while True:
+            yield current
+            current = next_link[current]
+            if current == x:
+                return
+
+    def groups(self) -> dict:
+        """
+        Return every set, keyed by its root, in O(n).
+
+        Return:
+            dict: A mapping from each root to the list of elements in its set.
+        """
+
+        parent = self.parent
+        return {
+            root: list(self.members(root))
+            for root in range(len(parent))
+            if parent[root] == root
+        }
+
+    def find_many(self,xs) -> list:
+        """
+        Find the roots of several elements at once.
+
+        Parameters:
+            xs (iterable): The elements whose set representatives are to be found.
+                A NumPy array is resolved with vectorized pointer jumping.
+
+        Return:
+            list | numpy.ndarray: The root of each element, in order.
+        """
+
+        if np is not None and isinstance(xs, np.ndarray):
+            parent = np.frombuffer(self.parent, dtype=np.int32)
+            roots = parent[xs]
+            while True:
+                grandparents = parent[roots]
+                if np.array_equal(grandparents, roots):
+                    break
+                roots = grandparents
+            parent[xs] = roots
+            return roots
+
+        find = self.find
+        return [find(x) for x in xs]
+
+    def union_many(self,pairs):
+        """
+        Merge the sets of every (x, y) pair.
+
+        Parameters:
+            pairs (iterable): The pairs of elements to merge. A NumPy array of
+                shape (m, 2) is merged with the vectorized edge-list mode.
+        """
+
+        if np is not None and isinstance(pairs, np.ndarray):
+            self._union_many_numpy(pairs)
+            return
+
+        parent = self.parent
+        rank = self.rank
+        set_size = self.set_size
+        next_link = self.next
+        merged = 0
+        for x, y in pairs:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+
+            if x != y:
+                if rank[x] < rank[y]:
+                    x, y = y, x
+                elif rank[x] == rank[y]:
+                    rank[x] += 1
+                parent[y] = x
+                set_size[x] += set_size[y]
+                next_link[x], next_link[y] = next_link[y], next_link[x]
+                merged += 1
+
+        self.component_count -= merged
+
+    def _union_many_numpy(self,pairs):
+        """
+        Merge an edge list with whole-array operations.
+
+        Each round flattens every tree by pointer jumping, then hooks the larger
+        root of every still-split edge under the smaller one. Roots only ever
+        point to smaller ids, so no cycle can form even when several edges write
+        the same root in one round.
+        """
+
+        pairs = np.asarray(pairs, dtype=np.int32).reshape(-1, 2)
+        parent = np.frombuffer(self.parent, dtype=np.int32)
+        rank = np.frombuffer(self.rank, dtype=np.int32)
+        xs, ys = pairs[:, 0], pairs[:, 1]
+
+        while True:
+            while True:
+                grandparents = parent[parent]
+                if np.array_equal(grandparents, parent):
+                    break
+                parent[:] = grandparents
+
+            rootsX, rootsY = parent[xs], parent[ys]
+            split = rootsX != rootsY
+            if not split.any():
+                break
+            xs, ys = xs[split], ys[split]
+            rootsX, rootsY = rootsX[split], rootsY[split]
+            # Several edges can hook the same root in one round, let it take the
+            # smallest candidate so a star collapses in O(1) rounds.
+            np.minimum.at(parent, np.maximum(rootsX, rootsY), np.minimum(rootsX, rootsY))
+
+        # Every tree is now flat, so a root with children has height one.
+        roots = np.unique(parent[parent != np.arange(parent.size)])
+        rank[roots] = np.maximum(rank[roots], 2)
+        self._rebuild_components()
+
+    def _rebuild_components(self):
+        """
+        Recompute sizes, member rings and the component count from a fully
+        flattened parent array.
+        """
+
+        parent = np.frombuffer(self.parent, dtype=np.int32)
+        set_size = np.frombuffer(self.set_size, dtype=np.int32)
+        next_link = np.frombuffer(self.next, dtype=np.int32)
+
+        if parent.size == 0:
+            return
+
+        set_size[:] = np.bincount(parent, minlength=parent.size)
+        self.component_count = int(np.count_nonzero(parent == np.arange(parent.size)))
+
+        # Sorting by root lays every set out contiguously, each element then
+        # points to its neighbour and the last one wraps back to the first.
+        order = np.argsort(parent, kind='stable').astype(np.int32)
+        following = np.roll(order, -1)
+        group_start = np.flatnonzero(np.r_[True, parent[order[1:]] != parent[order[:-1]]])
+        group_end = np.r_[group_start[1:], order.size] - 1
+        following[group_end] = order[group_start]
+        next_link[order] = following
+
+
+class RollbackDisjointSet(DisjointSet):
+    def __init__(self,n:int):
+        """
+        Initialize a disjoint set whose unions can be undone.
+
+        Path compression is disabled and every union is recorded in a change
+        log, so each one can be reverted in O(1). Union by rank alone keeps
+        find at O(log n).
+
+        Parameters:
+            n (int): The number of elements in the set disjoined set.
+        """
+
+        super().__init__(n)
+        self.history = []
+
+    def find(self,x:int) -> int:
+        """
+        Find the root of the set containing the element 'x', without path compression.
+
+        Parameters:
+            x (int): The element whoes set representative is to be found.
+
+        Return:
+            int: The root of the set containing 'x'.
+        """
+
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(self,x:int,y:int):
+        """
+        Merge two sets containing elements 'x' and 'y' and record the change.
+
+        Parameters:
+            x (int): First element.
+            y (int): Second element.
+        """
+
+        rootX = self.find(x)
+        rootY = self.find(y)
+
+        if rootX != rootY:
+            if self.rank[rootX] < self.rank[rootY]:
+                rootX, rootY = rootY, rootX
+            grew = self.rank[rootX] == self.rank[rootY]
+            if grew:
+                self.rank[rootX] += 1
+            self._link(rootX, rootY)
+            self.history.append((rootX, rootY, grew))
+
+    def find_many(self,xs) -> list:
+        """
+        Find the roots of several elements, without compressing any path.
+        """
+
+        find = self.find
+        return [find(x) for x in xs]
+
+    def union_many(self,pairs):
+        """
+        Merge the sets of every (x, y) pair, recording each union for rollback.
+        """
+
+        union = self.union
+        for x, y in pairs:
+            union(x, y)
+
+    def checkpoint(self) -> int:
+        """
+        Return a marker for the current state, to be passed to `rollback`.
+
+        Return:
+            int: The number of unions recorded so far.
+        """
+
+        return len(self.history)
+
+    def rollback(self,checkpoint:int):
+        """
+        Undo every union made since 'checkpoint', most recent first.
+
+        Parameters:
+            checkpoint (int): A marker previously returned by `checkpoint`.
+        """
+
+        if not 0 <= checkpoint <= len(self.history):
+            raise ValueError(f"Invalid checkpoint {checkpoint}.")
+
+        while len(self.history) > checkpoint:
+            root, child, grew = self.history.pop()
+            self.parent[child] = child
+            if grew:
+                self.rank[root] -= 1
+            self.set_size[root] -= self.set_size[child]
+            # Swapping the same pair of links again splits the rings back apart.
+            self.next[root], self.next[child] = self.next[child], self.next[root]
+            self.component_count += 1
+
+
+class KeyedDisjointSet:
+    def __init__(self,items=()):
+        """
+        Initialize a disjoint set over arbitrary hashable items.
+
+        Items are interned to integer ids the first time they are seen and
+        stored in an integer DisjointSet whose arrays grow with each new item
+        (array.append over-allocates geometrically, so growth is amortized O(1)).
+
+        Parameters:
+            items (iterable): Optional items to add up front, each in its own set.
+        """
+
+        self.sets = DisjointSet(0)
+        self.ids = {}
+        self.items = []
+        for item in items:
+            self._intern(item)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self,item):
+        return item in self.ids
+
+    @property
+    def component_count(self) -> int:
+        return self.sets.component_count
+
+    def _intern(self,item) -> int:
+        """
+        Return the id of 'item', adding it as a new singleton set if it is unseen.
+        """
+
+        id = self.ids.get(item)
+        if id is None:
+            id = len(self.items)
+            self.ids[item] = id
+            self.items.append(item)
+            sets = self.sets
+            sets.parent.append(id)
+            sets.rank.append(1)
+            sets.set_size.append(1)
+            sets.next.append(id)
+            sets.component_count += 1
+        return id
+
+    def add(self,item):
+        """
+        Add 'item' as a singleton set if it is not present yet.
+
+        Parameters:
+            item (hashable): The item to add.
+        """
+
+        self._intern(item)
+
+    def find(self,item):
+        """
+        Find the representative item of the set containing 'item'.
+
+        Parameters:
+            item (hashable): The item whose set representative is to be found.
+
+        Return:
+            hashable: The representative of the set containing 'item'.
+        """
+
+        return self.items[self.sets.find(self._intern(item))]
+
+    def union(self,x,y):
+        """
+        Merge the sets containing items 'x' and 'y'.
+
+        Parameters:
+            x (hashable): First item.
+            y (hashable): Second item.
+        """
+
+        self.sets.union(self._intern(x), self._intern(y))
+
+    def find_many(self,items) -> list:
+        """
+        Find the representative items of several items at once.
+
+        Parameters:
+            items (iterable): The items whose set representatives are to be found.
+
+        Return:
+            list: The representative of each item, in order.
+        """
+
+        intern = self._intern
+        roots = self.sets.find_many([intern(item) for item in items])
+        return [self.items[root] for root in roots]
+
+    def union_many(self,pairs):
+        """
+        Merge the sets of every (x, y) pair of items.
+
+        Parameters:
+            pairs (iterable): The pairs of items to merge.
+        """
+
+        intern = self._intern
+        self.sets.union_many((intern(x), intern(y)) for x, y in pairs)
+
+    def size(self,item) -> int:
+        """
+        Return the number of items in the set containing 'item'.
+
+        Parameters:
+            item (hashable): The item whose set size is wanted.
+
+        Return:
+            int: The size of the set containing 'item'.
+        """
+
+        return self.sets.size(self._intern(item))
+
+    def members(self,item):
+        """
+        Iterate over the items of the set containing 'item' in O(set size).
+
+        Parameters:
+            item (hashable): Any item of the set.
+
+        Return:
+            generator: The items of the set, starting with 'item'.
+        """
+
+        items = self.items
+        for id in self.sets.members(self._intern(item)):
+            yield items[id]
+
+    def groups(self) -> dict:
+        """
+        Return every set, keyed by its representative item.
+
+        Return:
+            dict: A mapping from each representative to the list of items in its set.
+        """
+
+        items = self.items
+        return {
+            items[root]: [items[id] for id in ids]
+            for root, ids in self.sets.groups().items()
+        }
+
 
 if __name__ == '__main__':
     ds = DisjointSet(5)
@@ -56,4 +510,29 @@ if __name__ == '__main__':
     print(ds.find(1))  # Output: 0
     print(ds.find(2))  # Output: 0
     print(ds.find(3))  # Output: 3 (or the root of the set containing 3)
-    print(ds.find(4))  # Output: 3
\ No newline at end of file
+    print(ds.find(4))  # Output: 3
+    print(ds.find_many([0, 2, 4]))  # Output: [0, 0, 3]
+    print(ds.component_count)  # Output: 2
+    print(ds.size(1))  # Output: 3
+
+    if np is not None:
+        # A star whose hub has the highest id merges in a couple of vectorized rounds.
+        star = DisjointSet(10000)
+        star.union_many(np.array([(i, 9999) for i in range(9999)]))
+        print(star.component_count, star.size(0))  # Output: 1 10000
+    print(ds.groups())  # Output: {0: [0, 2, 1], 3: [3, 4]}
+
+    accounts = KeyedDisjointSet()
+    accounts.union('alice@example.com', 'acct-17')
+    accounts.union('acct-17', 'alice@work.example')
+    print(accounts.find('alice@work.example'))  # Output: alice@example.com
+    print(accounts.size('acct-17'))  # Output: 3
+    print(accounts.component_count)  # Output: 1
+
+    undoable = RollbackDisjointSet(4)
+    undoable.union(0, 1)
+    mark = undoable.checkpoint()
+    undoable.union(1, 2)
+    print(undoable.size(2))  # Output: 3
+    undoable.rollback(mark)
+    print(undoable.size(2))  # Output: 1
@@ -1,9 +1,14 @@
 class Node:
 
-    def __init__(self,key):
+    __slots__ = ('key','value','left','right','size')
+
+    def __init__(self,key,value=None):
         self.key = key
+        self.value = value
         self.right = None
         self.left = None
+        # Number of nodes in the subtree rooted at this node.
+        self.size = 1
 
 
     def __repr__(self):
@@ -15,6 +20,15 @@ class SplayTree:
     def __init__(self):
         self.root = None
 
+    def __len__(self):
+        return self.root.size if self.root else 0
+
+    def _update(self,node:Node):
+        """
+        Recompute the subtree size of node from its children.
+        """
+        node.size = 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+
     def _right_rotate(self,x:Node):
         """
         Apply the right rotate function at node x.
@@ -22,6 +36,8 @@ class SplayTree:
         y:Node = x.left
         x.left = y.right
         y.right = x
+        self._update(x)
+        self._update(y)
         return y
     
     def _left_rotate(self,x:Node):
@@ -31,66 +47,114 @@ class SplayTree:
         y:Node = x.right
         x.right = y.left
         y.left = x
+        self._update(x)
+        self._update(y)
         return y
     
     def _splay(self,root,key):
         """
         Bring the node with the given key to the root of the subtree rooted at 'root' by using the zig or zag move or the combination of two.
         If the key is not found, bring the last accessed node to the root.
+
+        The splay is top-down and iterative: nodes left of the search path are
+        hung on a left tree and nodes right of it on a right tree, and both are
+        reassembled under the final node, so no recursion depth is needed.
         """
 
-        if root is None or root.key == key:
+        if root is None:
             return root
-        
-        # The key is in the left subtree
-        if root.key > key:
-            if root.left is None:
-                return root #Key not found
-            
-            #Zig-Zig(left-left)
-            if root.left.key > key:
-                root.left.left = self._splay(root.left.left,key)
-                root = self._right_rotate(root)
-
-            #Zig-Zag(left-right)
-            elif root.left.key < key:
-                root.left.right = self._splay(root.left.right,key)
-                if root.left.right is not None:
-                    root.left = self._left_rotate(root.left)
-            return root if root.left is None else self._right_rotate(root)
-
-
-        # The key is in the right subtree
-        else:
-            if root.right is None:
-                return root
-
-            #Zag-Zig(right-left)
-            if root.right.key > key:
-                root.right.left = self._splay(root.right.left,key)
-                if root.right.left is not None:
-                    root.right = self._right_rotate(root.right)
-            #Zag-Zag(right-right)
-            elif root.right.key < key:
-                root.right.right = self._splay(root.right.right,key)
-                root = self._left_rotate(root)
-            return root if root.right is None else self._left_rotate(root)
-    
-    def insert(self,key):
+
+        header = Node(None)
+        left = right = header
+        node = root
+        # Nodes hung on the left and right trees, their sizes are fixed up afterwards.
+        left_path = []
+        right_path = []
+
+        while True:
+            if key < node.key:
+                if node.left is None:
+                    break
+                #Zig-Zig(left-left)
+                if key < node.left.key:
+                    node = self._right_rotate(node)
+                    if node.left is None:
+                        break
+                #Link right
+                right.left = node
+                right = node
+                right_path.append(node)
+                node = node.left
+            elif key > node.key:
+                if node.right is None:
+                    break
+                #Zag-Zag(right-right)
+                if key > node.right.key:
+                    node = self._left_rotate(node)
+                    if node.right is None:
+                        break
+                #Link left
+                left.right = node
+                left = node
+                left_path.append(node)
+                node = node.right
+            else:
+                break
+
+        #Assemble
+        left.right = node.left
+        right.left = node.right
+        node.left = header.right
+        node.right = header.left
+
+        # Each linked node's spine child is the next one linked, so update deepest first.
+        for linked in reversed(left_path):
+            self._update(linked)
+        for linked in reversed(right_path):
+            self._update(linked)
+        self._update(node)
+        return node
+
+    @classmethod
+    def from_sorted(cls,keys):
+        """
+        Build a perfectly balanced tree from strictly increasing keys in O(n).
+        Raise ValueError if the keys are not strictly increasing.
+        """
+        keys = list(keys)
+        for previous,key in zip(keys,keys[1:]):
+            if not previous < key:
+                raise ValueError("Keys must be strictly increasing.")
+
+        def _build(low,high):
+            if low > high:
+                return None
+            middle = (low + high)//2
+            node = Node(keys[middle])
+            node.left = _build(low,middle - 1)
+            node.right = _build(middle + 1,high)
+            node.size = high - low + 1
+            return node
+
+        tree = cls()
+        tree.root = _build(0,len(keys) - 1)
+        return tree
+
+    def insert(self,key,value=None):
         """
         Insert a new key into the tree.
+        Return True if the key was inserted, False if it was already in the tree.
         """
         if self.root is None:
-            self.root = Node(key)
-            return
+            self.root = Node(key,value)
+            return True
         
         self.root = self._splay(self.root,key)
         
         if self.root.key == key:
-            print(f"Key {key} is allready in the tree.")
-            return
+            return False
         
-        new_node = Node(key)
+        new_node = Node(key,value)
 
         if self.root.key > key:
             new_node.right = self.root
@@ -100,19 +164,24 @@ class SplayTree:
             new_node.left = self.root
             new_node.right = self.root.right
             self.root.right = None
+        self._update(self.root)
+        self._update(new_node)
         self.root = new_node
+        return True
 
 
     def delete(self,key):
+        """
+        Delete a key from the tree.
+        Raise KeyError if the key is not in the tree.
+        """
         if self.root is None:
-            print("Tree is empty.")
-            return 
+            raise KeyError(key)
 
         self.root = self._splay(self.root,key)
 
         if self.root.key != key:
-            print(f"Key {key} not found.")
-            return 
+            raise KeyError(key)
         
         if self.root.left is None:
             self.root = self.root.right
@@ -120,23 +189,253 @@ class SplayTree:
             temp = self.root.right
             self.root = self._splay(self.root.left,key)
             self.root.right = temp
+            self._update(self.root)
         
     def search(self,key):
+        """
+        Return True if the key is in the tree, splaying the last accessed node to the root.
+        """
         self.root = self._splay(self.root,key)
-        found  = self.root is not None and self.root.key == key
-        print(f"{'Found' if found else 'Did not found'} {key}.")
-        return found
+        return self.root is not None and self.root.key == key
     
-    def inorder_traversal(self):
+    def __contains__(self,key):
+        return self.search(key)
 
-        def _inorder(node):
-            if node:
-                _inorder(node.left)
-                print(node.key,end=" ")
-                _inorder(node.right)
-        
-        _inorder(self.root)
-        print()
+    def __getitem__(self,key):
+        """
+        Return the value stored for key, raise KeyError if it is not in the tree.
+        """
+        if not self.search(key):
+            raise KeyError(key)
+        return self.root.value
+
+    def __setitem__(self,key,value):
+        """
+        Store value for key, replacing the value of an existing key.
+        """
+        if self.search(key):
+            self.root.value = value
+        else:
+            self.insert(key,value)
+
+    def __delitem__(self,key):
+        self.delete(key)
+
+    def get(self,key,default=None):
+        """
+        Return the value stored for key, or default if it is not in the tree.
+        """
+        return self.root.value if self.search(key) else default
+
+    def __iter__(self):
+        for key,_ in self.items():
+            yield key
+
+    def items(self,lo=None,hi=None):
+        """
+        Lazily yield the (key, value) pairs with lo <= key < hi in increasing
+        order. A bound of None is unbounded. Subtrees outside the range are
+        skipped and the tree is not splayed while iterating.
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and not node.key < hi:
+                return
+            yield node.key,node.value
+            node = node.right
+
+    def _max(self,node):
+        while node.right:
+            node = node.right
+        return node
+
+    def _min(self,node):
+        while node.left:
+            node = node.left
+        return node
+
+    def _neighbour(self,key,below,inclusive):
+        """
+        Splay key and return the closest key below (or above) it, or None.
+        """
+        if self.root is None:
+            return None
+        self.root = self._splay(self.root,key)
+        root = self.root
+        if inclusive and root.key == key:
+            return root.key
+        if below:
+            if root.key < key:
+                return root.key
+            return self._max(root.left).key if root.left else None
+        if key < root.key:
+            return root.key
+        return self._min(root.right).key if root.right else None
+
+    def floor(self,key):
+        """
+        Return the largest key <= key, or None.
+        """
+        return self._neighbour(key,below=True,inclusive=True)
+
+    def ceiling(self,key):
+        """
+        Return the smallest key >= key, or None.
+        """
+        return self._neighbour(key,below=False,inclusive=True)
+
+    def predecessor(self,key):
+        """
+        Return the largest key < key, or None.
+        """
+        return self._neighbour(key,below=True,inclusive=False)
+
+    def successor(self,key):
+        """
+        Return the smallest key > key, or None.
+        """
+        return self._neighbour(key,below=False,inclusive=False)
+
+    def rank(self,key):
+        """
+        Return the number of keys smaller than key.
+        """
+        if self.root is None:
+            return 0
+        self.root = self._splay(self.root,key)
+        smaller = self.root.left.size if self.root.left else 0
+        return smaller + 1 if self.root.key < key else smaller
+
+    def select(self,k):
+        """
+        Return the k-th smallest key (0-indexed) and splay it to the root.
+        Raise IndexError if k is out of range.
+        """
+        if not 0 <= k < len(self):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            smaller = node.left.size if node.left else 0
+            if k < smaller:
+                node = node.left
+            elif k > smaller:
+                k -= smaller + 1
+                node = node.right
+            else:
+                break
+        self.root = self._splay(self.root,node.key)
+        return node.key
+
+    def _splay_extreme(self,largest):
+        """
+        Splay the smallest (or largest) key to the root and return it.
+        """
+        node = self._max(self.root) if largest else self._min(self.root)
+        self.root = self._splay(self.root,node.key)
+        return self.root
+
+    def split(self,key):
+        """
+        Split the tree into two trees, one with the keys < key and one with the
+        keys >= key, in amortized O(log n). The nodes are moved, so this tree
+        is left empty.
+        """
+        left,right = SplayTree(),SplayTree()
+        if self.root is not None:
+            root = self._splay(self.root,key)
+            if root.key < key:
+                right.root = root.right
+                root.right = None
+                left.root = root
+            else:
+                left.root = root.left
+                root.left = None
+                right.root = root
+            self._update(root)
+            self.root = None
+        return left,right
+
+    @classmethod
+    def join(cls,left,right):
+        """
+        Join two trees where every key of left is smaller than every key of
+        right, in amortized O(log n). The nodes are moved, so both trees are
+        left empty. Raise ValueError if the key ranges overlap.
+        """
+        tree = cls()
+        if left.root is None or right.root is None:
+            tree.root = left.root or right.root
+        else:
+            root = left._splay_extreme(largest=True)
+            if not root.key < right._splay_extreme(largest=False).key:
+                raise ValueError("Every key of left must be smaller than every key of right.")
+            root.right = right.root
+            left._update(root)
+            tree.root = root
+        left.root = right.root = None
+        return tree
+
+    def merge(self,other):
+        """
+        Move every key of other into this tree, leaving other empty. Keys in
+        both trees keep the value from other.
+
+        Runs of consecutive keys from the same tree are moved with one split
+        and one join each, so merging trees with disjoint key ranges costs
+        O(log n) and interleaved trees O(runs * log n), instead of one splay
+        per key.
+        """
+        pieces = []
+        mine,theirs = SplayTree(),SplayTree()
+        mine.root,theirs.root = self.root,other.root
+        self.root = other.root = None
+
+        # Repeatedly cut the run of keys below the other tree's minimum.
+        first,second = mine,theirs
+        while first.root is not None and second.root is not None:
+            first_min = first._splay_extreme(largest=False).key
+            second_min = second._splay_extreme(largest=False).key
+            if second_min < first_min:
+                first,second = second,first
+            elif first_min == second_min:
+                mine.delete(first_min)
+                continue
+            run,rest = first.split(second._splay_extreme(largest=False).key)
+            pieces.append(run)
+            first.root = rest.root
+            first,second = second,first
+        pieces.append(first if first.root is not None else second)
+
+        tree = pieces[0]
+        for piece in pieces[1:]:
+            tree = SplayTree.join(tree,piece)
+        self.root = tree.root
+
+    def inorder_traversal(self):
+        """
+        Return the keys of the tree in increasing order.
+        """
+        keys = []
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            keys.append(node.key)
+            node = node.right
+        return keys
 
 if __name__ == '__main__':
     # Example usage
@@ -144,49 +443,49 @@ if __name__ == '__main__':
 
     print("Initial Insertions:")
     # Insert elements
-    tree.insert(10)
-    tree.insert(20)
-    tree.insert(5)
-    tree.insert(15)
-    tree.insert(25)
+    for key in (10, 20, 5, 15, 25):
+        tree.insert(key)
 
     # In-order traversal after initial insertions
     print("In-order traversal after initial insertions:")
-    tree.inorder_traversal()
+    print(tree.inorder_traversal())
 
     print("\nSearching for an Existing Element:")
     # Search for an element that exists
-    tree.search(15)  # This should splay 15 to the root
+    print("Found 15:", tree.search(15))  # This should splay 15 to the root
 
     print("\nIn-order traversal after searching for 15:")
-    tree.inorder_traversal()
+    print(tree.inorder_traversal())
 
     print("\nSearching for a Non-Existent Element:")
     # Search for an element that doesn’t exist
-    tree.search(30)  # This should bring the closest accessed node to the root
+    print("Found 30:", tree.search(30))  # This should bring the closest accessed node to the root
 
     print("\nIn-order traversal after searching for 30 (non-existent):")
-    tree.inorder_traversal()
+    print(tree.inorder_traversal())
 
     print("\nAttempting to Insert a Duplicate:")
     # Attempt to insert a duplicate element
-    tree.insert(15)  # Since 15 already exists, no new insertion should occur
+    print("Inserted 15:", tree.insert(15))  # Since 15 already exists, no new insertion should occur
 
     print("\nIn-order traversal after attempting to insert duplicate 15:")
-    tree.inorder_traversal()
+    print(tree.inorder_traversal())
 
     print("\nDeleting Elements:")
     # Delete an element that exists
     tree.delete(10)  # This should remove 10 from the tree
 
     print("\nIn-order traversal after deleting 10:")
-    tree.inorder_traversal()
+    print(tree.inorder_traversal())
 
     # Delete an element that doesn’t exist
-    tree.delete(30)  # This should not change the tree
+    try:
+        tree.delete(30)  # This should not change the tree
+    except KeyError:
+        print("Key 30 not found.")
 
     print("\nIn-order traversal after attempting to delete 30 (non-existent):")
-    tree.inorder_traversal()
+    print(tree.inorder_traversal())
 
     # Delete the root element
     print("\nDeleting the Root Element (current root):")
@@ -194,17 +493,38 @@ if __name__ == '__main__':
         tree.delete(tree.root.key)  # Delete current root, which is 25 if no prior splay
 
     print("\nIn-order traversal after deleting the current root:")
-    tree.inorder_traversal()
+    print(tree.inorder_traversal())
 
     print("\nTesting Edge Case with Empty Tree:")
     # Testing on an empty tree
     empty_tree = SplayTree()
 
     # Attempt to delete on an empty tree
-    empty_tree.delete(5)
+    try:
+        empty_tree.delete(5)
+    except KeyError:
+        print("Tree is empty.")
 
     # Attempt to search in an empty tree
-    empty_tree.search(5)
+    print("Found 5:", empty_tree.search(5))
 
     print("In-order traversal of empty tree:")
-    empty_tree.inorder_traversal()
+    print(empty_tree.inorder_traversal())
+
+    print("\nBuilding a balanced tree from sorted keys:")
+    balanced = SplayTree.from_sorted(range(1, 8))
+    print("Root:", balanced.root)  # Output: Node(4)
+
+    print("\nUsing the tree as an ordered map:")
+    index = SplayTree()
+    for key in (30, 10, 50, 20, 40):
+        index[key] = f"page-{key}"
+    print(index[20], index.get(35))  # Output: page-20 None
+    print(list(index.items(20, 50)))  # Output: keys 20, 30 and 40 with their values
+    print(index.floor(35), index.ceiling(35))  # Output: 30 40
+    print(index.rank(40), index.select(0))  # Output: 3 10
+
+    print("\nSplitting and joining trees:")
+    low, high = index.split(30)
+    print(low.inorder_traversal(), high.inorder_traversal())  # Output: [10, 20] [30, 40, 50]
+    print(SplayTree.join(low, high).inorder_traversal())  # Output: [10, 20, 30, 40, 50]
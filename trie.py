@@ -1,31 +1,212 @@
+import heapq
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+
 class TrieNode:
+    __slots__ = (
+        "children", "is_end_of_word", "weight", "max_weight", "count", "prefix_count", "fail", "output"
+    )
+
     def __init__(self):
         """Initialize a node in the Trie.
         Each node contains a dictionary of child nodes and a boolean flag to indicate the end of a word.
+        A word end also has a weight and an insertion count, and every node keeps the largest weight
+        and the total insertion count of its subtree.
         """
         self.children = {}
         self.is_end_of_word = False
+        self.weight = 0
+        self.max_weight = float("-inf")
+        self.count = 0
+        self.prefix_count = 0
+        # Aho-Corasick links, set by Trie.build_automaton: the node of the longest proper
+        # suffix in the Trie, and the nearest such suffix node that ends a word.
+        self.fail = None
+        self.output = None
+
+    def _refresh_max_weight(self):
+        """Recompute max_weight from the node's own weight and its children."""
+
+        best = self.weight if self.is_end_of_word else float("-inf")
+        for child in self.children.values():
+            if child.max_weight > best:
+                best = child.max_weight
+        self.max_weight = best
 
 
 class Trie:
     def __init__(self):
         """Initialize the root of the Trie."""
         self.root = TrieNode()
+        self._automaton = None
 
-    def insert(self, word: str):
+    def insert(self, word: str, weight: float = None):
         """
         Insert a word in the Trie.
 
         Parameters
             word (str): The word to insert into the Trie.
+            weight (float): The score used by top_k. When omitted, a word that is
+                already in the Trie keeps its weight and a new word gets 0.
         """
 
+        self._automaton = None
         node = self.root
+        node.prefix_count += 1
+        path = [node]
         for char in word:
             if char not in node.children:
                 node.children[char] = TrieNode()
             node = node.children[char]
+            node.prefix_count += 1
+            path.append(node)
+
+        if weight is None:
+            weight = node.weight if node.is_end_of_word else 0
+        lowered = node.is_end_of_word and weight < node.weight
         node.is_end_of_word = True
+        node.weight = weight
+        node.count += 1
+
+        if lowered:
+            # The old weight may have been the maximum of some subtrees.
+            for path_node in reversed(path):
+                path_node._refresh_max_weight()
+        else:
+            for path_node in path:
+                if weight > path_node.max_weight:
+                    path_node.max_weight = weight
+
+    def insert_many(self, words):
+        """
+        Insert several words in the Trie, each with the default weight of insert.
+
+        Every word starts from the node path of the previous word at their common
+        prefix instead of from the root, and the counters of that shared path are
+        only updated once the path is left. Pre-sorted input shares the longest
+        prefixes, so each word costs O(characters past the common prefix).
+
+        Parameters
+            words (iterable): The words to insert into the Trie.
+        """
+
+        self._automaton = None
+        # path[i] is the node of previous[:i], pending[i] the insertions that
+        # still have to be added to prefix_count of path[i] and its ancestors.
+        path = [self.root]
+        pending = [0]
+        previous = ""
+        for word in words:
+            common = 0
+            shortest = min(len(word), len(previous))
+            while common < shortest and word[common] == previous[common]:
+                common += 1
+            self._unwind(path, pending, common + 1)
+
+            node = path[-1]
+            for char in word[common:]:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = TrieNode()
+                node = child
+                path.append(node)
+                pending.append(0)
+
+            node.is_end_of_word = True
+            node.count += 1
+            if node.weight > node.max_weight:
+                node.max_weight = node.weight
+            pending[-1] += 1
+            previous = word
+
+        self._unwind(path, pending, 1)
+        self.root.prefix_count += pending[0]
+
+    def _unwind(self, path: list, pending: list, depth: int):
+        """
+        Pop the nodes of 'path' deeper than 'depth', adding their pending counts
+        and their max_weight to their parents.
+        """
+
+        while len(path) > depth:
+            node = path.pop()
+            added = pending.pop()
+            node.prefix_count += added
+            pending[-1] += added
+            parent = path[-1]
+            if node.max_weight > parent.max_weight:
+                parent.max_weight = node.max_weight
+
+    def count(self, word: str) -> int:
+        """
+        Return how many times a word was inserted in the Trie.
+
+        Parameters:
+            word (str): The word to count.
+
+        Return:
+            int: The number of insertions of the word, 0 if it is not in the Trie.
+        """
+
+        node = self._find(word)
+        return node.count if node is not None else 0
+
+    def count_prefix(self, prefix: str) -> int:
+        """
+        Return how many insertions were of words starting with the given prefix,
+        in O(|prefix|).
+
+        Parameters:
+            prefix (str): The prefix to count.
+
+        Return:
+            int: The total insertion count of the words that start with the prefix.
+        """
+
+        node = self._find(prefix)
+        return node.prefix_count if node is not None else 0
+
+    def delete(self, word: str) -> bool:
+        """
+        Delete a word, with all of its insertions, from the Trie and prune the
+        branches left without any word.
+
+        Parameters:
+            word (str): The word to delete.
+
+        Return:
+            bool: True if the word was in the Trie, otherwise False.
+        """
+
+        node = self.root
+        path = [node]
+        for char in word:
+            node = node.children.get(char)
+            if node is None:
+                return False
+            path.append(node)
+        if not node.is_end_of_word:
+            return False
+
+        self._automaton = None
+        removed = node.count
+        for path_node in path:
+            path_node.prefix_count -= removed
+        node.is_end_of_word = False
+        node.count = 0
+        node.weight = 0
+
+        depth = len(word)
+        while depth > 0 and not path[depth].children and not path[depth].is_end_of_word:
+            del path[depth - 1].children[word[depth - 1]]
+            depth -= 1
+        for path_node in reversed(path[:depth + 1]):
+            path_node._refresh_max_weight()
+        return True
 
     def search(self, word: str) -> bool:
         """
@@ -86,10 +267,584 @@ class Trie:
                 words.append(current_prefix)
 
             for char, child_node in current_node.children.items():
-                stack.append((child_node, prefix + char))
+                stack.append((child_node, current_prefix + char))
 
         return words
 
+    def _find(self, prefix: str) -> TrieNode:
+        """Return the node reached by 'prefix', or None."""
+
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def iter_prefix(self, prefix: str = "", limit: int = None):
+        """
+        Lazily yield the words that start with the given prefix, in lexicographic order.
+
+        Parameters:
+            prefix (str): The prefix to search for.
+            limit (int): The maximum number of words to yield, or None for all of them.
+
+        Return:
+            generator: The matching words.
+        """
+
+        node = self._find(prefix)
+        if node is None or limit == 0:
+            return
+
+        yielded = 0
+        stack = [(node, prefix)]
+        while stack:
+            current_node, current_prefix = stack.pop()
+            if current_node.is_end_of_word:
+                yield current_prefix
+                yielded += 1
+                if yielded == limit:
+                    return
+            # Pushed in reverse so the smallest character is visited first.
+            for char in sorted(current_node.children, reverse=True):
+                stack.append((current_node.children[char], current_prefix + char))
+
+    def top_k(self, prefix: str, k: int) -> list[tuple[str, float]]:
+        """
+        Return the k heaviest words that start with the given prefix.
+
+        The search is best-first on the subtree maximum weights, so only the
+        branches that can still hold one of the k best words are expanded.
+
+        Parameters:
+            prefix (str): The prefix to search for.
+            k (int): The number of words to return.
+
+        Return:
+            list: (word, weight) pairs, heaviest first and ties in lexicographic order.
+        """
+
+        node = self._find(prefix)
+        if node is None or k <= 0:
+            return []
+
+        results = []
+        # Entries are (-weight, text, is_subtree, node); a word entry sorts before
+        # the subtree it heads when their weights are equal.
+        heap = [(-node.max_weight, prefix, True, node)]
+        while heap and len(results) < k:
+            negative_weight, text, is_subtree, current_node = heapq.heappop(heap)
+            if not is_subtree:
+                results.append((text, -negative_weight))
+                continue
+            if current_node.is_end_of_word:
+                heapq.heappush(heap, (-current_node.weight, text, False, None))
+            for char, child_node in current_node.children.items():
+                if child_node.max_weight != float("-inf"):
+                    heapq.heappush(heap, (-child_node.max_weight, text + char, True, child_node))
+        return results
+
+    def fuzzy_search(self, word: str, max_distance: int) -> list[tuple[str, int]]:
+        """
+        Return the words within 'max_distance' edits (Levenshtein distance) of 'word'.
+
+        The Trie is walked depth-first carrying one row of the edit distance table
+        per node, so words sharing a prefix share the work for it. A branch is
+        pruned as soon as every entry of its row exceeds 'max_distance'.
+
+        Parameters:
+            word (str): The word to match.
+            max_distance (int): The largest number of insertions, deletions and
+                substitutions allowed.
+
+        Return:
+            list: (word, distance) pairs, closest first and ties in lexicographic order.
+        """
+
+        columns = len(word) + 1
+        first_row = list(range(columns))
+        matches = []
+        if self.root.is_end_of_word and first_row[-1] <= max_distance:
+            matches.append(("", first_row[-1]))
+
+        stack = [(child_node, char, char, first_row) for char, child_node in self.root.children.items()]
+        while stack:
+            node, char, path, previous_row = stack.pop()
+            row = [previous_row[0] + 1]
+            for column in range(1, columns):
+                row.append(
+                    min(
+                        row[column - 1] + 1,
+                        previous_row[column] + 1,
+                        previous_row[column - 1] + (word[column - 1] != char),
+                    )
+                )
+            if node.is_end_of_word and row[-1] <= max_distance:
+                matches.append((path, row[-1]))
+            if min(row) <= max_distance:
+                for child_char, child_node in node.children.items():
+                    stack.append((child_node, child_char, path + child_char, row))
+        return sorted(matches, key=lambda match: (match[1], match[0]))
+
+    def build_automaton(self):
+        """
+        Turn the Trie into an Aho-Corasick automaton for find_all.
+
+        Every node gets a failure link (the node of its longest proper suffix in the
+        Trie) and an output link (the nearest node on the failure chain that ends a
+        word). The graph is then compiled into flat tables indexed by state number.
+        Inserting or deleting a word discards the tables; they are rebuilt on the
+        next find_all.
+        """
+
+        root = self.root
+        root.fail = root
+        root.output = None
+
+        # Breadth-first, so the failure link of a node is set before its children need it.
+        nodes = [root]
+        paths = [""]
+        for node, path in zip(nodes, paths):
+            for char, child in node.children.items():
+                fail = node.fail
+                while fail is not root and char not in fail.children:
+                    fail = fail.fail
+                child.fail = fail.children.get(char, root) if node is not root else root
+                if child.fail.is_end_of_word and child.fail is not root:
+                    child.output = child.fail
+                else:
+                    child.output = child.fail.output
+                nodes.append(child)
+                paths.append(path + char)
+
+        states = {id(node): state for state, node in enumerate(nodes)}
+        goto = [{char: states[id(child)] for char, child in node.children.items()} for node in nodes]
+        fail = [states[id(node.fail)] for node in nodes]
+        output = [states[id(node.output)] if node.output is not None else 0 for node in nodes]
+        # The empty word is not reported as a match.
+        words = [path if node.is_end_of_word and path else None for node, path in zip(nodes, paths)]
+        self._automaton = (goto, fail, output, words)
+
+    def find_all(self, text_or_chunks):
+        """
+        Yield every occurrence of every word of the Trie in a text, in a single pass
+        over the characters.
+
+        Parameters:
+            text_or_chunks (str | iterable): The text, or an iterable of text chunks
+                that are scanned as one continuous text without being joined, so
+                matches spanning chunk boundaries are found.
+
+        Return:
+            generator: (position, word) pairs, where position is the index of the first
+                character of the match in the whole text, ordered by where the match ends.
+        """
+
+        if self._automaton is None:
+            self.build_automaton()
+        goto, fail, output, words = self._automaton
+
+        chunks = [text_or_chunks] if isinstance(text_or_chunks, str) else text_or_chunks
+        state = 0
+        offset = 0
+        for chunk in chunks:
+            for index, char in enumerate(chunk, offset):
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+
+                match = state if words[state] is not None else output[state]
+                while match:
+                    word = words[match]
+                    yield index - len(word) + 1, word
+                    match = output[match]
+            offset += len(chunk)
+
+    def _nodes(self):
+        """Yield every node of the Trie, starting with the root."""
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children.values())
+
+    def node_count(self) -> int:
+        """Return the number of nodes in the Trie, including the root."""
+
+        return sum(1 for _ in self._nodes())
+
+    def edge_count(self) -> int:
+        """Return the number of edges in the Trie, one per character stored."""
+
+        return self.node_count() - 1
+
+    def memory_usage(self) -> int:
+        """
+        Return the approximate memory used by the Trie in bytes, counting every
+        node and its children dictionary.
+        """
+
+        return sum(
+            sys.getsizeof(node) + sys.getsizeof(node.children) for node in self._nodes()
+        )
+
+    def freeze(self) -> "FrozenTrie":
+        """
+        Return an immutable, array-packed snapshot of the Trie.
+
+        Return:
+            FrozenTrie: The snapshot, answering the same queries as the Trie.
+        """
+
+        child_start = array("I")
+        labels = array("I", [0])
+        ends = array("B")
+
+        # Breadth-first numbering with sorted children keeps the children of
+        # every node contiguous and ordered by label.
+        queue = [self.root]
+        for node in queue:
+            child_start.append(len(queue))
+            ends.append(node.is_end_of_word)
+            for char in sorted(node.children):
+                labels.append(ord(char))
+                queue.append(node.children[char])
+        child_start.append(len(queue))
+
+        return FrozenTrie(child_start, labels, ends)
+
+
+class FrozenTrie:
+    # File layout: magic, node count, byte order of the arrays ("<" or ">"), padding
+    # that keeps the arrays aligned, then the child_start, labels and ends arrays.
+    # The arrays are mapped in place, so they stay in the byte order of the machine
+    # that saved them. The last three magic bytes are the format version.
+    MAGIC = b"FTRIE002"
+    HEADER = struct.Struct("<8sQc7x")
+    BYTE_ORDER = b"<" if sys.byteorder == "little" else b">"
+
+    def __init__(self, child_start, labels, ends):
+        """
+        Initialize a read-only Trie stored in flat arrays, as built by Trie.freeze.
+
+        Nodes are numbered breadth-first, so the children of node i are the
+        nodes child_start[i] to child_start[i + 1] - 1, sorted by label.
+
+        Parameters:
+            child_start: The id of the first child of every node, plus one past the end.
+            labels: The code point of the character leading to every node.
+            ends: 1 for the nodes where a word ends, 0 otherwise.
+        """
+        self.child_start = child_start
+        self.labels = labels
+        self.ends = ends
+        self._mmap = None
+
+    def _child(self, node: int, char: str) -> int:
+        """Return the child of 'node' reached by 'char', or -1."""
+
+        low, high = self.child_start[node], self.child_start[node + 1]
+        code = ord(char)
+        index = bisect_left(self.labels, code, low, high)
+        if index < high and self.labels[index] == code:
+            return index
+        return -1
+
+    def _find(self, prefix: str) -> int:
+        """Return the node reached by 'prefix', or -1."""
+
+        node = 0
+        for char in prefix:
+            node = self._child(node, char)
+            if node == -1:
+                break
+        return node
+
+    def search(self, word: str) -> bool:
+        """
+        Search for a word in the FrozenTrie.
+
+        Parameters:
+            word (str): The word to search for.
+
+        Return:
+            bool: True if the word is in the FrozenTrie, otherwise False.
+        """
+
+        node = self._find(word)
+        return node != -1 and bool(self.ends[node])
+
+    def starts_with(self, prefix: str) -> list[str]:
+        """
+        Return all words in the FrozenTrie that start with the given prefix.
+
+        Parameters:
+            prefix (str): The prefix to search for
+
+        Return:
+            list: A list of words that start with the given prefix.
+        """
+
+        node = self._find(prefix)
+        if node == -1:
+            return []
+
+        words = []
+        stack = [(node, prefix)]
+        while stack:
+            current_node, current_prefix = stack.pop()
+            if self.ends[current_node]:
+                words.append(current_prefix)
+            for child in range(self.child_start[current_node], self.child_start[current_node + 1]):
+                stack.append((child, current_prefix + chr(self.labels[child])))
+        return words
+
+    def node_count(self) -> int:
+        """Return the number of nodes in the FrozenTrie, including the root."""
+
+        return len(self.ends)
+
+    def memory_usage(self) -> int:
+        """Return the number of bytes used by the arrays of the FrozenTrie."""
+
+        return sum(
+            len(values) * values.itemsize
+            for values in (self.child_start, self.labels, self.ends)
+        )
+
+    def save(self, path: str):
+        """
+        Write the FrozenTrie to 'path' so it can be loaded with FrozenTrie.open.
+
+        Parameters:
+            path (str): The file to write.
+        """
+
+        with open(path, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, len(self.ends), self.BYTE_ORDER))
+            for values in (self.child_start, self.labels, self.ends):
+                file.write(values.tobytes() if isinstance(values, array) else bytes(values))
+
+    @classmethod
+    def open(cls, path: str) -> "FrozenTrie":
+        """
+        Load a FrozenTrie saved with save() by memory-mapping its file.
+
+        The arrays are used in place, so every process opening the same file
+        shares one page-cached copy and nothing is unpickled or re-inserted.
+
+        Parameters:
+            path (str): The file to open.
+
+        Raises:
+            ValueError: If the file is not a FrozenTrie of this format, was saved
+                with another byte order, or is truncated.
+
+        Return:
+            FrozenTrie: The loaded FrozenTrie.
+        """
+
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        error = None
+        if len(buffer) < cls.HEADER.size:
+            error = f"{path} is not a saved FrozenTrie."
+        else:
+            magic, count, byte_order = cls.HEADER.unpack_from(buffer)
+            layout = (("I", count + 1), ("I", count), ("B", count))
+            if magic[:5] == cls.MAGIC[:5] and magic != cls.MAGIC:
+                version = magic[5:].decode("ascii", "replace")
+                error = f"{path} uses FrozenTrie format {version}, expected {cls.MAGIC[5:].decode()}."
+            elif magic != cls.MAGIC:
+                error = f"{path} is not a saved FrozenTrie."
+            elif byte_order != cls.BYTE_ORDER:
+                error = f"{path} was saved with byte order {byte_order!r}, this machine uses {cls.BYTE_ORDER!r}."
+            elif len(buffer) < cls.HEADER.size + sum(
+                length * array(typecode).itemsize for typecode, length in layout
+            ):
+                error = f"{path} is truncated, it should hold {count} nodes."
+        if error is not None:
+            buffer.close()
+            raise ValueError(error)
+
+        view = memoryview(buffer)
+        offset = cls.HEADER.size
+        arrays = []
+        for typecode, length in layout:
+            size = length * array(typecode).itemsize
+            arrays.append(view[offset:offset + size].cast(typecode))
+            offset += size
+
+        frozen_trie = cls(*arrays)
+        frozen_trie._mmap = buffer
+        return frozen_trie
+
+    def close(self):
+        """Release the memory map of a FrozenTrie loaded with FrozenTrie.open."""
+
+        if self._mmap is not None:
+            for values in (self.child_start, self.labels, self.ends):
+                values.release()
+            self._mmap.close()
+            self._mmap = None
+
+
+class RadixNode:
+    __slots__ = ("label", "children", "is_end_of_word")
+
+    def __init__(self, label: str = ""):
+        """Initialize a node in the RadixTrie.
+        The node holds the label of the edge leading to it, a dictionary of child nodes keyed by the
+        first character of their label and a boolean flag to indicate the end of a word.
+        """
+        self.label = label
+        self.children = {}
+        self.is_end_of_word = False
+
+
+class RadixTrie:
+    def __init__(self):
+        """
+        Initialize a radix (Patricia) Trie. Chains of single-child nodes are
+        collapsed into one edge with a multi-character label, so there is one
+        node per branch point or word end instead of one per character.
+        """
+        self.root = RadixNode()
+
+    def insert(self, word: str):
+        """
+        Insert a word in the RadixTrie, splitting an edge where the word leaves it.
+
+        Parameters
+            word (str): The word to insert into the RadixTrie.
+        """
+
+        node = self.root
+        index = 0
+        while index < len(word):
+            child = node.children.get(word[index])
+            if child is None:
+                child = RadixNode(word[index:])
+                node.children[word[index]] = child
+                node = child
+                break
+
+            label = child.label
+            if word.startswith(label, index):
+                node = child
+                index += len(label)
+                continue
+
+            # Split the edge at the first mismatch.
+            common = 1
+            while common < len(label) and index + common < len(word) and label[common] == word[index + common]:
+                common += 1
+            middle = RadixNode(label[:common])
+            child.label = label[common:]
+            middle.children[child.label[0]] = child
+            node.children[word[index]] = middle
+            node = middle
+            index += common
+
+        node.is_end_of_word = True
+
+    def _find(self, prefix: str):
+        """
+        Walk the RadixTrie along 'prefix'.
+
+        Return:
+            tuple: The node reached and the full path to it (which can extend past the
+                prefix when it ends inside an edge label), or (None, None).
+        """
+
+        node = self.root
+        index = 0
+        while index < len(prefix):
+            child = node.children.get(prefix[index])
+            if child is None:
+                return None, None
+            label = child.label
+            if prefix.startswith(label, index):
+                index += len(label)
+            elif label.startswith(prefix[index:]):
+                return child, prefix[:index] + label
+            else:
+                return None, None
+            node = child
+        return node, prefix
+
+    def search(self, word: str) -> bool:
+        """
+        Search for a word in the RadixTrie.
+
+        Parameters:
+            word (str): The word to search for in the RadixTrie.
+
+        Return:
+            bool: True if the word is in the RadixTrie, otherwise False.
+        """
+
+        node, path = self._find(word)
+        return node is not None and path == word and node.is_end_of_word
+
+    def starts_with(self, prefix: str) -> list[str]:
+        """
+        Return all words in the RadixTrie that start with the given prefix.
+
+        Parameters:
+            prefix (str): The prefix to search for
+
+        Return:
+            list: A list of words that start with the given prefix.
+        """
+
+        node, path = self._find(prefix)
+        if node is None:
+            return []
+
+        words = []
+        stack = [(node, path)]
+        while stack:
+            current_node, current_path = stack.pop()
+            if current_node.is_end_of_word:
+                words.append(current_path)
+            for child_node in current_node.children.values():
+                stack.append((child_node, current_path + child_node.label))
+        return words
+
+    def _nodes(self):
+        """Yield every node of the RadixTrie, starting with the root."""
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children.values())
+
+    def node_count(self) -> int:
+        """Return the number of nodes in the RadixTrie, including the root."""
+
+        return sum(1 for _ in self._nodes())
+
+    def edge_count(self) -> int:
+        """Return the number of edges (labels) in the RadixTrie."""
+
+        return self.node_count() - 1
+
+    def memory_usage(self) -> int:
+        """
+        Return the approximate memory used by the RadixTrie in bytes, counting
+        every node, its children dictionary and its edge label.
+        """
+
+        return sum(
+            sys.getsizeof(node) + sys.getsizeof(node.children) + sys.getsizeof(node.label)
+            for node in self._nodes()
+        )
+
 
 if __name__ == "__main__":
     trie = Trie()
@@ -133,3 +888,58 @@ if __name__ == "__main__":
     print(
         "Words that start with '':", trie.starts_with("")
     )  # Expected: All inserted words
+
+    print("\nPrefix completion Tests:")
+    print(
+        "First 2 words that start with 'a':", list(trie.iter_prefix("a", limit=2))
+    )  # Expected: ['app', 'apple']
+    trie.insert("apple", weight=5)
+    trie.insert("apricot", weight=9)
+    trie.insert("app", weight=1)
+    print(
+        "Top 2 words that start with 'ap':", trie.top_k("ap", 2)
+    )  # Expected: [('apricot', 9), ('apple', 5)]
+
+    print("\nRadix Trie:")
+    radix_trie = RadixTrie()
+    for word in ["apple", "app", "apricot", "banana", "bat", "batman"]:
+        radix_trie.insert(word)
+    print("Search for 'apricot':", radix_trie.search("apricot"))  # Expected: True
+    print(
+        "Words that start with 'ba':", radix_trie.starts_with("ba")
+    )  # Expected: ['banana', 'bat', 'batman']
+    print(
+        "Nodes:", trie.node_count(), "->", radix_trie.node_count()
+    )  # Expected: 21 -> 9
+    print("Bytes:", trie.memory_usage(), "->", radix_trie.memory_usage())
+
+    print("\nFrozen Trie:")
+    frozen_trie = trie.freeze()
+    print("Search for 'batman':", frozen_trie.search("batman"))  # Expected: True
+    print(
+        "Words that start with 'ap':", frozen_trie.starts_with("ap")
+    )  # Expected: ['app', 'apple', 'apricot']
+    print("Bytes:", frozen_trie.memory_usage())
+
+    print("\nFuzzy search Tests:")
+    print(
+        "Words within 1 edit of 'bar':", trie.fuzzy_search("bar", 1)
+    )  # Expected: [('bat', 1)]
+
+    print("\nCounting Tests:")
+    queries = Trie()
+    queries.insert_many(sorted(["cat", "car", "cat", "cart", "dog"]))
+    print("Count of 'cat':", queries.count("cat"))  # Expected: 2
+    print("Count of prefix 'ca':", queries.count_prefix("ca"))  # Expected: 4
+    queries.delete("cart")
+    print("Count of prefix 'car' after delete:", queries.count_prefix("car"))  # Expected: 1
+
+    print("\nMulti-pattern matching Tests:")
+    keywords = Trie()
+    keywords.insert_many(["he", "she", "his", "hers"])
+    print(
+        "Matches in 'ushers':", list(keywords.find_all("ushers"))
+    )  # Expected: [(1, 'she'), (2, 'he'), (2, 'hers')]
+    print(
+        "Matches across chunks:", list(keywords.find_all(["us", "hers"]))
+    )  # Expected: [(1, 'she'), (2, 'he'), (2, 'hers')]